@@ -6,9 +6,10 @@ KIS API Manager - 모든 KIS API 모듈들을 통합 관리하는 메인 API 매
 """
 import time
 import asyncio
+import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple, cast
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import pandas as pd
 
 from . import kis_auth
@@ -16,7 +17,12 @@ from . import kis_account_api
 from . import kis_market_api
 from . import kis_order_api
 from utils.logger import setup_logger
-from utils.korean_time import now_kst
+from utils.korean_time import now_kst, is_before_market_open
+
+# 체결 내역 수량 필드 (우선순위 순) 및 값이 없음을 뜻하는 표기
+_FILLED_QTY_FIELDS = ('tot_ccld_qty', 'ccld_qty', 'cnc_cfrm_qty')
+_ORDER_QTY_FIELDS = ('ord_qty', 'ord_qty_org')
+_EMPTY_QTY_VALUES = frozenset({'', '-', 'None', 'nan', None})
 
 
 @dataclass
@@ -27,6 +33,8 @@ class OrderResult:
     message: str = ""
     error_code: str = ""
     data: Optional[Dict[str, Any]] = None
+    krx_fwdg_ord_orgno: str = ""  # 한국거래소전송주문조직번호 (주문 응답)
+    order_data: Dict[str, Any] = field(default_factory=dict)  # 대기 주문에 함께 저장할 부가 정보
 
 
 @dataclass
@@ -63,6 +71,11 @@ class KISAPIManager:
         self.call_count = 0
         self.error_count = 0
         self.last_call_time = time.time()
+        self._rate_limit_lock = threading.Lock()
+        
+        # 주문 상태 일괄 조회용 계좌 단위 조회 결과 캐시 (같은 틱의 만료/체결 확인이 공유)
+        self._order_inquiry_cache: Optional[Tuple[float, Optional[pd.DataFrame], Optional[pd.DataFrame]]] = None
+        self._order_inquiry_ttl = 1.0  # 초
         
         # 실패 재시도 설정
         self.max_retries = 3
@@ -179,15 +192,16 @@ class KISAPIManager:
         return None
     
     def _rate_limit(self):
-        """API 호출 속도 제한"""
-        current_time = time.time()
-        time_diff = current_time - self.last_call_time
-        
-        # 최소 간격 (60ms) 보장
-        if time_diff < 0.06:
-            time.sleep(0.06 - time_diff)
-        
-        self.last_call_time = time.time()
+        """API 호출 속도 제한 (스레드 안전)"""
+        with self._rate_limit_lock:
+            current_time = time.time()
+            time_diff = current_time - self.last_call_time
+            
+            # 최소 간격 (60ms) 보장
+            if time_diff < 0.06:
+                time.sleep(0.06 - time_diff)
+            
+            self.last_call_time = time.time()
     
     # ===========================================
     # 계좌 조회 API
@@ -384,6 +398,8 @@ class KISAPIManager:
                 kis_order_api.get_order_cash,
                 "buy", stock_code, quantity, price
             )
+            # 주문 응답 이후 무효화 (요청 중 다른 스레드가 채운 주문 전 조회 결과도 함께 폐기)
+            self._order_inquiry_cache = None
             
             if result is None or result.empty:
                 return OrderResult(
@@ -399,7 +415,8 @@ class KISAPIManager:
                     success=True,
                     order_id=order_id,
                     message="매수 주문 성공",
-                    data=data.to_dict()
+                    data=data.to_dict(),
+                    krx_fwdg_ord_orgno=data.get('KRX_FWDG_ORD_ORGNO', '')
                 )
             else:
                 return OrderResult(
@@ -422,6 +439,8 @@ class KISAPIManager:
                 kis_order_api.get_order_cash,
                 "sell", stock_code, quantity, price
             )
+            # 주문 응답 이후 무효화 (요청 중 다른 스레드가 채운 주문 전 조회 결과도 함께 폐기)
+            self._order_inquiry_cache = None
             
             if result is None or result.empty:
                 return OrderResult(
@@ -437,7 +456,8 @@ class KISAPIManager:
                     success=True,
                     order_id=order_id,
                     message="매도 주문 성공",
-                    data=data.to_dict()
+                    data=data.to_dict(),
+                    krx_fwdg_ord_orgno=data.get('KRX_FWDG_ORD_ORGNO', '')
                 )
             else:
                 return OrderResult(
@@ -456,8 +476,6 @@ class KISAPIManager:
     def cancel_order(self, order_id: str, stock_code: str, order_type: str = "00") -> OrderResult:
         """주문 취소 (향상된 디버깅)"""
         try:
-            from utils.korean_time import is_before_market_open, now_kst
-            
             current_time = now_kst()
             self.logger.info(f"🔍 주문 취소 시도: {order_id} (종목: {stock_code}) 시간: {current_time.strftime('%H:%M:%S')}")
             
@@ -570,6 +588,8 @@ class KISAPIManager:
                 0,                        # 가격 (취소시 0)
                 "Y"                       # 전량취소
             )
+            # 취소 응답 이후 무효화하여 다음 조회에 취소 결과 반영
+            self._order_inquiry_cache = None
             
             if result is None:
                 self.logger.error(f"❌ 주문 취소 API 호출 실패: {order_id}")
@@ -622,275 +642,334 @@ class KISAPIManager:
         try:
             self.logger.debug(f"🔍 주문 상태 조회 시작: {order_id}")
             
-            # 1. 미체결 주문 조회 (정정취소 가능 주문)
-            pending_orders = self._call_api_with_retry(
-                kis_order_api.get_inquire_psbl_rvsecncl_lst
-            )
+            pending_orders, daily_results = self._fetch_order_inquiries()
+            return self._resolve_order_status(order_id, pending_orders, daily_results)
             
-            # 2. 미체결 주문 목록에서 해당 주문 찾기
-            is_pending = False
-            pending_order_data = None
+        except Exception as e:
+            self.logger.error(f"❌ 주문 상태 조회 실패 {order_id}: {e}")
+            return None
+    
+    def get_order_statuses(self, order_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        여러 주문의 상태 일괄 조회
+        
+        미체결 주문 목록과 당일 체결 내역은 계좌 단위 조회이므로 한 번만 호출하고,
+        주문별 상태 판정은 조회 결과를 공유하여 수행합니다.
+        
+        Args:
+            order_ids: 조회할 주문번호 목록
+            
+        Returns:
+            Dict[str, Optional[Dict[str, Any]]]: 주문번호별 상태 (get_order_status와 동일한 형식)
+        """
+        if not order_ids:
+            return {}
+        
+        try:
+            self.logger.debug(f"🔍 주문 상태 일괄 조회 시작: {len(order_ids)}건")
+            pending_orders, daily_results = self._get_order_inquiries_cached()
+        except Exception as e:
+            self.logger.error(f"❌ 주문 상태 일괄 조회 실패: {e}")
+            return {order_id: None for order_id in order_ids}
+        
+        # 계좌 단위 조회가 하나라도 실패하면 모든 주문이 '미발견'으로 판정되지 않도록 이번 조회는 건너뜀
+        if pending_orders is None or daily_results is None:
+            self.logger.warning(f"⚠️ 주문 조회 결과 없음 - 주문 상태 일괄 조회 건너뜀 ({len(order_ids)}건)")
+            return {order_id: None for order_id in order_ids}
+        
+        statuses: Dict[str, Optional[Dict[str, Any]]] = {}
+        for order_id in order_ids:
+            try:
+                statuses[order_id] = self._resolve_order_status(order_id, pending_orders, daily_results)
+            except Exception as e:
+                self.logger.error(f"❌ 주문 상태 조회 실패 {order_id}: {e}")
+                statuses[order_id] = None
+        
+        return statuses
+    
+    def _get_order_inquiries_cached(self) -> Tuple[Optional[pd.DataFrame], Optional[pd.DataFrame]]:
+        """계좌 단위 주문 조회 결과 (TTL 이내 재호출 시 캐시 반환, 조회 실패 결과는 캐시하지 않음)"""
+        cached = self._order_inquiry_cache
+        if cached is not None and time.monotonic() - cached[0] < self._order_inquiry_ttl:
+            return cached[1], cached[2]
+        
+        pending_orders, daily_results = self._fetch_order_inquiries()
+        if pending_orders is not None and daily_results is not None:
+            self._order_inquiry_cache = (time.monotonic(), pending_orders, daily_results)
+        return pending_orders, daily_results
+    
+    def _fetch_order_inquiries(self) -> Tuple[Optional[pd.DataFrame], Optional[pd.DataFrame]]:
+        """미체결 주문 목록과 당일 체결 내역 조회 (계좌 단위)"""
+        # 1. 미체결 주문 조회 (정정취소 가능 주문)
+        pending_orders = self._call_api_with_retry(
+            kis_order_api.get_inquire_psbl_rvsecncl_lst
+        )
+        
+        # 3. 체결 내역 조회 (완전 체결 확인 및 상세 정보용)
+        # 🆕 체결 내역 조회 시 더 안전한 API 호출 - 당일만 조회
+        daily_results = None
+        try:
+            today = datetime.today().strftime("%Y%m%d")
             
-            if pending_orders is not None and not pending_orders.empty:
-                target_pending = pending_orders[pending_orders['odno'] == order_id]
-                if not target_pending.empty:
-                    is_pending = True
-                    pending_order_data = target_pending.iloc[0].to_dict()
-                    self.logger.debug(f"📋 미체결 주문에서 발견: {order_id}")
+            daily_results = self._call_api_with_retry(
+                kis_order_api.get_inquire_daily_ccld_lst,
+                "01",  # 3개월 이내
+                today,  # 시작일: 오늘
+                today   # 종료일: 오늘
+            )
             
-            # 3. 체결 내역 조회 (완전 체결 확인 및 상세 정보용)
-            # 🆕 체결 내역 조회 시 더 안전한 API 호출 - 당일만 조회
+            # 🔧 API 응답 검증
+            if daily_results is not None:
+                if daily_results.empty:
+                    self.logger.debug(f"📊 체결 내역 조회 결과: 빈 데이터프레임 (당일)")
+                else:
+                    self.logger.debug(f"📊 체결 내역 조회 결과: {len(daily_results)}건 (당일)")
+                    # 응답 데이터 구조 검증 - 올바른 필드명 사용
+                    required_fields = ['odno', 'tot_ccld_qty', 'ord_qty']
+                    missing_fields = [field for field in required_fields if field not in daily_results.columns]
+                    if missing_fields:
+                        self.logger.warning(f"⚠️ 체결 내역 응답에서 누락된 필드: {missing_fields}")
+                        self.logger.debug(f"📋 실제 필드 목록: {list(daily_results.columns)}")
+            else:
+                self.logger.warning(f"⚠️ 체결 내역 조회 API 호출 실패")
+                
+        except Exception as api_error:
+            self.logger.error(f"❌ 체결 내역 조회 중 오류: {api_error}")
             daily_results = None
+        
+        return pending_orders, daily_results
+    
+    def _resolve_order_status(self, order_id: str,
+                              pending_orders: Optional[pd.DataFrame],
+                              daily_results: Optional[pd.DataFrame]) -> Optional[Dict[str, Any]]:
+        """조회된 미체결 주문 목록/체결 내역에서 개별 주문 상태 판정"""
+        # 2. 미체결 주문 목록에서 해당 주문 찾기
+        is_pending = False
+        pending_order_data = None
+        
+        if pending_orders is not None and not pending_orders.empty:
+            target_pending = pending_orders[pending_orders['odno'] == order_id]
+            if not target_pending.empty:
+                is_pending = True
+                pending_order_data = target_pending.iloc[0].to_dict()
+                self.logger.debug(f"📋 미체결 주문에서 발견: {order_id}")
+        
+        # 4. 해당 주문의 모든 체결 레코드 찾기
+        all_filled_records = None
+        if daily_results is not None and not daily_results.empty:
+            all_filled_records = daily_results[daily_results['odno'] == order_id]
+            if not all_filled_records.empty:
+                self.logger.debug(f"📋 체결 내역에서 발견: {order_id} ({len(all_filled_records)}건)")
+        
+        # 5. 주문 상태 결정 및 데이터 생성
+        if is_pending and pending_order_data:
+            # 🔄 미체결 주문이 존재 = 부분 체결 또는 미체결
+            order_data = pending_order_data.copy()
+            
+            # 🔧 개선: 안전한 수량 계산
             try:
-                from datetime import datetime
-                today = datetime.today().strftime("%Y%m%d")
+                total_order_qty = int(float(str(order_data.get('ord_qty', 0))))      # 원주문수량
+                remaining_qty = int(float(str(order_data.get('rmn_qty', 0))))        # 잔여수량  
                 
-                daily_results = self._call_api_with_retry(
-                    kis_order_api.get_inquire_daily_ccld_lst,
-                    "01",  # 3개월 이내
-                    today,  # 시작일: 오늘
-                    today   # 종료일: 오늘
-                )
-                
-                # 🔧 API 응답 검증
-                if daily_results is not None:
-                    if daily_results.empty:
-                        self.logger.debug(f"📊 체결 내역 조회 결과: 빈 데이터프레임 (당일)")
-                    else:
-                        self.logger.debug(f"📊 체결 내역 조회 결과: {len(daily_results)}건 (당일)")
-                        # 응답 데이터 구조 검증 - 올바른 필드명 사용
-                        required_fields = ['odno', 'tot_ccld_qty', 'ord_qty']
-                        missing_fields = [field for field in required_fields if field not in daily_results.columns]
-                        if missing_fields:
-                            self.logger.warning(f"⚠️ 체결 내역 응답에서 누락된 필드: {missing_fields}")
-                            self.logger.debug(f"📋 실제 필드 목록: {list(daily_results.columns)}")
-                else:
-                    self.logger.warning(f"⚠️ 체결 내역 조회 API 호출 실패")
-                    
-            except Exception as api_error:
-                self.logger.error(f"❌ 체결 내역 조회 중 오류: {api_error}")
-                daily_results = None
-            
-            # 4. 해당 주문의 모든 체결 레코드 찾기
-            all_filled_records = None
-            if daily_results is not None and not daily_results.empty:
-                all_filled_records = daily_results[daily_results['odno'] == order_id]
-                if not all_filled_records.empty:
-                    self.logger.debug(f"📋 체결 내역에서 발견: {order_id} ({len(all_filled_records)}건)")
-            
-            # 5. 주문 상태 결정 및 데이터 생성
-            if is_pending and pending_order_data:
-                # 🔄 미체결 주문이 존재 = 부분 체결 또는 미체결
-                order_data = pending_order_data.copy()
+                # 🚨 핵심 수정: 미체결 주문의 체결량은 실제 체결 내역에서만 가져와야 함
+                # API의 미체결 주문 조회에서는 rmn_qty만 신뢰할 수 있음
+                filled_qty = 0  # 기본값: 미체결
                 
-                # 🔧 개선: 안전한 수량 계산
-                try:
-                    total_order_qty = int(float(str(order_data.get('ord_qty', 0))))      # 원주문수량
-                    remaining_qty = int(float(str(order_data.get('rmn_qty', 0))))        # 잔여수량  
+                # 당일 체결 내역에서 해당 주문의 실제 체결량 확인
+                if daily_results is not None and not daily_results.empty:
+                    today_filled_records = daily_results[daily_results['odno'] == order_id]
+                    if not today_filled_records.empty:
+                        # 당일 체결 내역이 있으면 실제 체결량 계산
+                        for _, record in today_filled_records.iterrows():
+                            try:
+                                record_filled = int(float(str(record.get('tot_ccld_qty', 0)).replace(',', '')))
+                                filled_qty += record_filled
+                            except (ValueError, TypeError):
+                                continue
+                        self.logger.debug(f"📊 당일 체결 내역에서 체결량 확인: {order_id} - {filled_qty}주")
                     
-                    # 🚨 핵심 수정: 미체결 주문의 체결량은 실제 체결 내역에서만 가져와야 함
-                    # API의 미체결 주문 조회에서는 rmn_qty만 신뢰할 수 있음
-                    filled_qty = 0  # 기본값: 미체결
+                # 🔧 검증: 체결량 + 잔여량 = 주문량이어야 함
+                expected_filled = max(0, total_order_qty - remaining_qty)
+                if filled_qty != expected_filled:
+                    self.logger.warning(f"⚠️ 체결량 불일치 감지: {order_id} - "
+                                      f"체결내역: {filled_qty}주, 계산값: {expected_filled}주")
+                    # 🚨 핵심 수정: 실제 체결량을 우선하되, 0이면 계산값 사용
+                    if filled_qty == 0 and expected_filled > 0:
+                        self.logger.info(f"📊 체결량 0이므로 잔여량 기준 계산값 사용: {expected_filled}주")
+                        filled_qty = expected_filled
+                    else:
+                        self.logger.info(f"📊 실제 체결 내역 우선 사용: {filled_qty}주")
+                        # 실제 체결량이 0이 아니면 그대로 사용
                     
-                    # 당일 체결 내역에서 해당 주문의 실제 체결량 확인
-                    if daily_results is not None and not daily_results.empty:
-                        today_filled_records = daily_results[daily_results['odno'] == order_id]
-                        if not today_filled_records.empty:
-                            # 당일 체결 내역이 있으면 실제 체결량 계산
-                            for _, record in today_filled_records.iterrows():
-                                try:
-                                    record_filled = int(float(str(record.get('tot_ccld_qty', 0)).replace(',', '')))
-                                    filled_qty += record_filled
-                                except (ValueError, TypeError):
-                                    continue
-                            self.logger.debug(f"📊 당일 체결 내역에서 체결량 확인: {order_id} - {filled_qty}주")
-                        
-                    # 🔧 검증: 체결량 + 잔여량 = 주문량이어야 함
-                    expected_filled = max(0, total_order_qty - remaining_qty)
-                    if filled_qty != expected_filled:
-                        self.logger.warning(f"⚠️ 체결량 불일치 감지: {order_id} - "
-                                          f"체결내역: {filled_qty}주, 계산값: {expected_filled}주")
-                        # 🚨 핵심 수정: 실제 체결량을 우선하되, 0이면 계산값 사용
-                        if filled_qty == 0 and expected_filled > 0:
-                            self.logger.info(f"📊 체결량 0이므로 잔여량 기준 계산값 사용: {expected_filled}주")
-                            filled_qty = expected_filled
-                        else:
-                            self.logger.info(f"📊 실제 체결 내역 우선 사용: {filled_qty}주")
-                            # 실제 체결량이 0이 아니면 그대로 사용
-                        
-                except (ValueError, TypeError) as e:
-                    self.logger.error(f"❌ 미체결 주문 수량 파싱 오류: {order_id} - {e}")
-                    return None
+            except (ValueError, TypeError) as e:
+                self.logger.error(f"❌ 미체결 주문 수량 파싱 오류: {order_id} - {e}")
+                return None
+            
+            # 🔧 개선: 데이터 검증
+            if total_order_qty <= 0:
+                self.logger.warning(f"⚠️ 유효하지 않은 주문수량: {order_id} - {total_order_qty}")
+                return None
+            
+            order_data['tot_ccld_qty'] = str(filled_qty)             # 총체결수량
+            order_data['rmn_qty'] = str(remaining_qty)               # 잔여수량
+            order_data['ord_qty'] = str(total_order_qty)             # 주문수량
+            order_data['cncl_yn'] = 'N'                              # 취소여부
+            
+            if filled_qty > 0:
+                self.logger.info(f"🔄 부분 체결 상태: {order_id} - 체결: {filled_qty}/{total_order_qty} (잔여: {remaining_qty})")
+            else:
+                self.logger.debug(f"📊 미체결 상태: {order_id} - 주문량: {total_order_qty} (잔여: {remaining_qty})")
+            
+        elif all_filled_records is not None and not all_filled_records.empty:
+            # ✅ 미체결 주문 목록에 없고 체결 내역 존재 = 완전 체결
+            
+            # 🔧 개선: 체결 수량 계산 로직 강화
+            total_filled_qty = 0
+            order_qty = 0
+            last_record = None
+            
+            self.logger.debug(f"📊 체결 내역 분석 시작: {order_id}")
+            
+            for idx, record in all_filled_records.iterrows():
+                # 🔧 개선: 다양한 체결량 필드명 확인 및 안전한 변환
+                # KIS API는 응답 시점에 따라 다른 필드명 사용 가능 (API 문서 기준)
+                possible_qty_fields = ['tot_ccld_qty', 'ord_qty', 'rmn_qty', 'cnc_cfrm_qty']
+                ccld_qty_str = '0'
+                ord_qty_str = '0'
                 
-                # 🔧 개선: 데이터 검증
-                if total_order_qty <= 0:
-                    self.logger.warning(f"⚠️ 유효하지 않은 주문수량: {order_id} - {total_order_qty}")
-                    return None
+                # 체결량 필드 찾기 (API 문서 기준 우선순위 순으로)
+                for field in _FILLED_QTY_FIELDS:
+                    if field in record and record[field] not in _EMPTY_QTY_VALUES:
+                        ccld_qty_str = str(record[field]).strip()
+                        break
                 
-                order_data['tot_ccld_qty'] = str(filled_qty)             # 총체결수량
-                order_data['rmn_qty'] = str(remaining_qty)               # 잔여수량
-                order_data['ord_qty'] = str(total_order_qty)             # 주문수량
-                order_data['cncl_yn'] = 'N'                              # 취소여부
+                # 주문량 필드 찾기
+                for field in _ORDER_QTY_FIELDS:
+                    if field in record and record[field] not in _EMPTY_QTY_VALUES:
+                        ord_qty_str = str(record[field]).strip()
+                        break
                 
-                if filled_qty > 0:
-                    self.logger.info(f"🔄 부분 체결 상태: {order_id} - 체결: {filled_qty}/{total_order_qty} (잔여: {remaining_qty})")
-                else:
-                    self.logger.debug(f"📊 미체결 상태: {order_id} - 주문량: {total_order_qty} (잔여: {remaining_qty})")
+                # 빈 문자열이나 '-' 처리
+                if ccld_qty_str in _EMPTY_QTY_VALUES:
+                    ccld_qty_str = '0'
+                if ord_qty_str in _EMPTY_QTY_VALUES:
+                    ord_qty_str = '0'
                 
-            elif all_filled_records is not None and not all_filled_records.empty:
-                # ✅ 미체결 주문 목록에 없고 체결 내역 존재 = 완전 체결
+                try:
+                    # 쉼표 제거 후 변환
+                    ccld_qty_str = ccld_qty_str.replace(',', '')
+                    ord_qty_str = ord_qty_str.replace(',', '')
+                    ccld_qty = int(float(ccld_qty_str))  # float로 먼저 변환 후 int
+                    ord_qty = int(float(ord_qty_str))
+                except (ValueError, TypeError):
+                    self.logger.warning(f"⚠️ 체결량 변환 실패: ccld_qty={ccld_qty_str}, ord_qty={ord_qty_str}")
+                    self.logger.debug(f"📋 전체 레코드 데이터: {record.to_dict()}")
+                    ccld_qty = 0
+                    ord_qty = 0
                 
-                # 🔧 개선: 체결 수량 계산 로직 강화
-                total_filled_qty = 0
-                order_qty = 0
-                last_record = None
+                total_filled_qty += ccld_qty
+                if ord_qty > 0:  # 주문수량이 유효한 경우에만 업데이트
+                    order_qty = ord_qty
+                last_record = record
                 
-                self.logger.debug(f"📊 체결 내역 분석 시작: {order_id}")
+                self.logger.debug(f"  📊 체결 레코드 {idx+1}: 체결량={ccld_qty}, 주문량={ord_qty}")
                 
+                # 🔧 추가: 레코드별 상세 정보 로깅 (디버깅용)
+                if ccld_qty > 0:
+                    self.logger.debug(f"    ✅ 유효한 체결: 시간={record.get('ord_tmd', 'N/A')}, 가격={record.get('avg_prvs', record.get('ccld_unpr', 'N/A'))}")
+                else:
+                    self.logger.debug(f"    ⚠️ 체결량 0: 가능한 필드값들 = {[record.get(f, 'N/A') for f in possible_qty_fields]}")
+            
+            # 🚨 핵심 수정: 체결량이 0인 경우 실제 미체결 상태로 처리
+            if total_filled_qty == 0 and order_qty > 0:
+                # 체결 내역은 있지만 체결량이 0인 경우 = 실제로는 아직 미체결
+                self.logger.info(f"📊 체결 내역에서 체결량 0 확인: {order_id} - 실제 미체결 상태")
+                self.logger.debug(f"📋 체결 내역 상세:")
                 for idx, record in all_filled_records.iterrows():
-                    # 🔧 개선: 다양한 체결량 필드명 확인 및 안전한 변환
-                    # KIS API는 응답 시점에 따라 다른 필드명 사용 가능 (API 문서 기준)
-                    possible_qty_fields = ['tot_ccld_qty', 'ord_qty', 'rmn_qty', 'cnc_cfrm_qty']
-                    ccld_qty_str = '0'
-                    ord_qty_str = '0'
-                    
-                    # 체결량 필드 찾기 (API 문서 기준 우선순위 순으로)
-                    for field in ['tot_ccld_qty', 'ccld_qty', 'cnc_cfrm_qty']:
-                        if field in record and record[field] not in ['', '-', 'None', 'nan', None]:
-                            ccld_qty_str = str(record[field]).strip()
-                            break
-                    
-                    # 주문량 필드 찾기
-                    for field in ['ord_qty', 'ord_qty_org']:
-                        if field in record and record[field] not in ['', '-', 'None', 'nan', None]:
-                            ord_qty_str = str(record[field]).strip()
-                            break
-                    
-                    # 빈 문자열이나 '-' 처리
-                    if ccld_qty_str in ['', '-', 'None', 'nan']:
-                        ccld_qty_str = '0'
-                    if ord_qty_str in ['', '-', 'None', 'nan']:
-                        ord_qty_str = '0'
-                    
-                    try:
-                        # 쉼표 제거 후 변환
-                        ccld_qty_str = ccld_qty_str.replace(',', '')
-                        ord_qty_str = ord_qty_str.replace(',', '')
-                        ccld_qty = int(float(ccld_qty_str))  # float로 먼저 변환 후 int
-                        ord_qty = int(float(ord_qty_str))
-                    except (ValueError, TypeError):
-                        self.logger.warning(f"⚠️ 체결량 변환 실패: ccld_qty={ccld_qty_str}, ord_qty={ord_qty_str}")
-                        self.logger.debug(f"📋 전체 레코드 데이터: {record.to_dict()}")
-                        ccld_qty = 0
-                        ord_qty = 0
-                    
-                    total_filled_qty += ccld_qty
-                    if ord_qty > 0:  # 주문수량이 유효한 경우에만 업데이트
-                        order_qty = ord_qty
-                    last_record = record
-                    
-                    self.logger.debug(f"  📊 체결 레코드 {idx+1}: 체결량={ccld_qty}, 주문량={ord_qty}")
-                    
-                    # 🔧 추가: 레코드별 상세 정보 로깅 (디버깅용)
-                    if ccld_qty > 0:
-                        self.logger.debug(f"    ✅ 유효한 체결: 시간={record.get('ord_tmd', 'N/A')}, 가격={record.get('avg_prvs', record.get('ccld_unpr', 'N/A'))}")
-                    else:
-                        self.logger.debug(f"    ⚠️ 체결량 0: 가능한 필드값들 = {[record.get(f, 'N/A') for f in possible_qty_fields]}")
+                    self.logger.debug(f"  레코드 {idx+1}: {record.to_dict()}")
                 
-                # 🚨 핵심 수정: 체결량이 0인 경우 실제 미체결 상태로 처리
-                if total_filled_qty == 0 and order_qty > 0:
-                    # 체결 내역은 있지만 체결량이 0인 경우 = 실제로는 아직 미체결
-                    self.logger.info(f"📊 체결 내역에서 체결량 0 확인: {order_id} - 실제 미체결 상태")
-                    self.logger.debug(f"📋 체결 내역 상세:")
-                    for idx, record in all_filled_records.iterrows():
-                        self.logger.debug(f"  레코드 {idx+1}: {record.to_dict()}")
-                    
-                    # 🆕 체결량이 0이면 미체결 주문으로 재분류하여 반환
-                    # (완전 체결 처리하지 않고 미체결로 처리)
-                    self.logger.info(f"🔄 체결량 0이므로 미체결 상태로 분류: {order_id}")
-                    
-                    # 미체결 상태로 반환 (remaining_qty = order_qty)
-                    return {
-                        'odno': order_id,
-                        'tot_ccld_qty': '0',           # 체결량 0
-                        'rmn_qty': str(order_qty),     # 잔여량 = 전체 주문량
-                        'ord_qty': str(order_qty),     # 주문량
-                        'cncl_yn': 'N',                # 취소 아님
-                        'ord_dvsn': last_record.get('ord_dvsn', '00') if last_record is not None else '00',
-                        'sll_buy_dvsn_cd': last_record.get('sll_buy_dvsn_cd', '01') if last_record is not None else '01',
-                        'pdno': last_record.get('pdno', '') if last_record is not None else '',
-                        'ord_unpr': last_record.get('ord_unpr', '0') if last_record is not None else '0',
-                        'actual_unfilled': True        # 실제 미체결 플래그
-                    }
+                # 🆕 체결량이 0이면 미체결 주문으로 재분류하여 반환
+                # (완전 체결 처리하지 않고 미체결로 처리)
+                self.logger.info(f"🔄 체결량 0이므로 미체결 상태로 분류: {order_id}")
                 
-                if last_record is not None:
-                    order_data = last_record.to_dict()
-                    order_data['tot_ccld_qty'] = str(total_filled_qty)   # 총체결수량 (실제 계산된 값)
-                    order_data['rmn_qty'] = str(max(0, order_qty - total_filled_qty))  # 잔여수량
-                    order_data['ord_qty'] = str(order_qty)              # 주문수량
-                    order_data['cncl_yn'] = 'N'                         # 취소여부
-                    
-                    if total_filled_qty == order_qty and total_filled_qty > 0:
-                        self.logger.info(f"✅ 완전 체결 확인: {order_id} - 체결: {total_filled_qty}/{order_qty}")
-                    else:
-                        self.logger.warning(f"⚠️ 체결 내역 불일치: {order_id} - 체결: {total_filled_qty}/{order_qty}")
+                # 미체결 상태로 반환 (remaining_qty = order_qty)
+                return {
+                    'odno': order_id,
+                    'tot_ccld_qty': '0',           # 체결량 0
+                    'rmn_qty': str(order_qty),     # 잔여량 = 전체 주문량
+                    'ord_qty': str(order_qty),     # 주문량
+                    'cncl_yn': 'N',                # 취소 아님
+                    'ord_dvsn': last_record.get('ord_dvsn', '00') if last_record is not None else '00',
+                    'sll_buy_dvsn_cd': last_record.get('sll_buy_dvsn_cd', '01') if last_record is not None else '01',
+                    'pdno': last_record.get('pdno', '') if last_record is not None else '',
+                    'ord_unpr': last_record.get('ord_unpr', '0') if last_record is not None else '0',
+                    'actual_unfilled': True        # 실제 미체결 플래그
+                }
+            
+            if last_record is not None:
+                order_data = last_record.to_dict()
+                order_data['tot_ccld_qty'] = str(total_filled_qty)   # 총체결수량 (실제 계산된 값)
+                order_data['rmn_qty'] = str(max(0, order_qty - total_filled_qty))  # 잔여수량
+                order_data['ord_qty'] = str(order_qty)              # 주문수량
+                order_data['cncl_yn'] = 'N'                         # 취소여부
+                
+                if total_filled_qty == order_qty and total_filled_qty > 0:
+                    self.logger.info(f"✅ 완전 체결 확인: {order_id} - 체결: {total_filled_qty}/{order_qty}")
                 else:
-                    self.logger.error(f"❌ 체결 내역 처리 실패: {order_id}")
-                    
-                    # 🆕 체결 내역 처리 실패 시 대체 방법: 계좌 잔고 조회로 확인
-                    try:
-                        self.logger.info(f"🔍 대체 확인 방법 시도: 계좌 잔고 조회로 체결 확인")
-                        from api.kis_market_api import get_stock_balance
-                        
-                        balance_result = get_stock_balance()
-                        if balance_result:
-                            balance_df, account_summary = balance_result
-                            
-                            # 주문 시점과 현재 잔고를 비교하여 체결 여부 추정
-                            # (이 방법은 완벽하지 않지만 마지막 수단으로 사용)
-                            self.logger.debug(f"📊 대체 확인: 계좌 잔고 기반 체결 추정 시도")
-                            
-                            # 기본 구조 반환 (미체결로 간주)
-                            return {
-                                'odno': order_id,
-                                'tot_ccld_qty': '0',
-                                'rmn_qty': '0', 
-                                'ord_qty': '0',
-                                'cncl_yn': 'N',
-                                'alternative_check': True  # 대체 확인 플래그
-                            }
-                    except Exception as alt_error:
-                        self.logger.error(f"❌ 대체 확인 방법도 실패: {alt_error}")
-                    
-                    return None
+                    self.logger.warning(f"⚠️ 체결 내역 불일치: {order_id} - 체결: {total_filled_qty}/{order_qty}")
             else:
-                # ❌ 미체결 주문도 없고 체결 내역도 없음 = 주문 취소 또는 오류
-                self.logger.warning(f"⚠️ 주문 상태 불명: {order_id} (미체결 목록과 체결 내역 모두에서 찾을 수 없음)")
+                self.logger.error(f"❌ 체결 내역 처리 실패: {order_id}")
                 
-                # 🆕 주문 상태 불명인 경우 기본 구조 반환 (None 대신)
-                # 이를 통해 OrderManager에서 적절한 처리가 가능하도록 함
-                order_data = {
-                    'odno': order_id,
-                    'tot_ccld_qty': '0',      # 체결수량 0으로 설정
-                    'rmn_qty': '0',           # 잔여수량 0으로 설정 
-                    'ord_qty': '0',           # 주문수량 불명
-                    'cncl_yn': 'Y',           # 취소된 것으로 추정
-                    'ord_dvsn': '00',         # 기본 주문구분
-                    'sll_buy_dvsn_cd': '01',  # 기본 매도매수구분
-                    'pdno': '',               # 종목코드 불명
-                    'ord_unpr': '0',          # 주문단가 불명
-                    'status_unknown': True    # 🆕 상태 불명 플래그
-                }
+                # 🆕 체결 내역 처리 실패 시 대체 방법: 계좌 잔고 조회로 확인
+                try:
+                    self.logger.info(f"🔍 대체 확인 방법 시도: 계좌 잔고 조회로 체결 확인")
+                    from api.kis_market_api import get_stock_balance
+                    
+                    balance_result = get_stock_balance()
+                    if balance_result:
+                        balance_df, account_summary = balance_result
+                        
+                        # 주문 시점과 현재 잔고를 비교하여 체결 여부 추정
+                        # (이 방법은 완벽하지 않지만 마지막 수단으로 사용)
+                        self.logger.debug(f"📊 대체 확인: 계좌 잔고 기반 체결 추정 시도")
+                        
+                        # 기본 구조 반환 (미체결로 간주)
+                        return {
+                            'odno': order_id,
+                            'tot_ccld_qty': '0',
+                            'rmn_qty': '0', 
+                            'ord_qty': '0',
+                            'cncl_yn': 'N',
+                            'alternative_check': True  # 대체 확인 플래그
+                        }
+                except Exception as alt_error:
+                    self.logger.error(f"❌ 대체 확인 방법도 실패: {alt_error}")
                 
-                self.logger.debug(f"📋 주문 상태 불명으로 기본 구조 반환: {order_id}")
-                return order_data
-            
-            self.logger.debug(f"✅ 주문 상태 조회 완료: {order_id}")
+                return None
+        else:
+            # ❌ 미체결 주문도 없고 체결 내역도 없음 = 주문 취소 또는 오류
+            self.logger.warning(f"⚠️ 주문 상태 불명: {order_id} (미체결 목록과 체결 내역 모두에서 찾을 수 없음)")
+            
+            # 🆕 주문 상태 불명인 경우 기본 구조 반환 (None 대신)
+            # 이를 통해 OrderManager에서 적절한 처리가 가능하도록 함
+            order_data = {
+                'odno': order_id,
+                'tot_ccld_qty': '0',      # 체결수량 0으로 설정
+                'rmn_qty': '0',           # 잔여수량 0으로 설정 
+                'ord_qty': '0',           # 주문수량 불명
+                'cncl_yn': 'Y',           # 취소된 것으로 추정
+                'ord_dvsn': '00',         # 기본 주문구분
+                'sll_buy_dvsn_cd': '01',  # 기본 매도매수구분
+                'pdno': '',               # 종목코드 불명
+                'ord_unpr': '0',          # 주문단가 불명
+                'status_unknown': True    # 🆕 상태 불명 플래그
+            }
+            
+            self.logger.debug(f"📋 주문 상태 불명으로 기본 구조 반환: {order_id}")
             return order_data
-            
-        except Exception as e:
-            self.logger.error(f"❌ 주문 상태 조회 실패 {order_id}: {e}")
-            return None
+        
+        self.logger.debug(f"✅ 주문 상태 조회 완료: {order_id}")
+        return order_data
     
     # ===========================================
     # 유틸리티 함수들
@@ -4,6 +4,7 @@ KIS API 인증/토큰 관리 모듈 (공식 문서 기반)
 import os
 import json
 import time
+import threading
 import yaml
 import requests
 from datetime import datetime
@@ -39,10 +40,15 @@ _DEBUG = False
 
 # API 호출 속도 제어를 위한 전역 변수들 추가
 _last_api_call_time = None
+_api_limit_lock = threading.Lock()  # 여러 스레드에서 주문을 보내도 호출 간격 보장
 _min_api_interval = 0.06  # 최소 60ms 간격 (초당 16-17회로 안전하게 설정, KIS 제한: 1초당 20건)
 _max_retries = 3  # 최대 재시도 횟수
 _retry_delay_base = 1.0  # 기본 재시도 지연 시간(초) - 줄임
 
+# HTTP 세션 (연결 재사용으로 호출마다 TCP/TLS 핸드셰이크 방지)
+_session = requests.Session()
+_session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
 # 기본 헤더
 _base_headers = {
     "Content-Type": "application/json",
@@ -166,7 +172,7 @@ def auth(svr: str = 'prod', product: str = '01') -> bool:
         url += '/oauth2/tokenP'
 
         try:
-            res = requests.post(url, data=json.dumps(p), headers=_getBaseHeader())
+            res = _session.post(url, data=json.dumps(p), headers=_getBaseHeader())
 
             if res.status_code == 200:
                 result = _getResultObject(res.json())
@@ -231,7 +237,7 @@ def set_order_hash_key(headers: Dict, params: Dict) -> None:
     url = f"{_TRENV.my_url}/uapi/hashkey"
 
     try:
-        res = requests.post(url, data=json.dumps(params), headers=headers)
+        res = _session.post(url, data=json.dumps(params), headers=headers)
         if res.status_code == 200:
             headers['hashkey'] = _getResultObject(res.json()).HASH
     except Exception as e:
@@ -334,9 +340,9 @@ def _url_fetch(api_url: str, ptr_id: str, tr_cont: str, params: Dict,
             if postFlag:
                 if hashFlag:
                     set_order_hash_key(headers, params)
-                res = requests.post(url, headers=headers, data=json.dumps(params))
+                res = _session.post(url, headers=headers, data=json.dumps(params))
             else:
-                res = requests.get(url, headers=headers, params=params)
+                res = _session.get(url, headers=headers, params=params)
 
             # 응답 처리
             if res.status_code == 200:
@@ -375,9 +381,9 @@ def _url_fetch(api_url: str, ptr_id: str, tr_cont: str, params: Dict,
                                 if postFlag:
                                     if hashFlag:
                                         set_order_hash_key(headers, params)
-                                    res = requests.post(url, headers=headers, data=json.dumps(params))
+                                    res = _session.post(url, headers=headers, data=json.dumps(params))
                                 else:
-                                    res = requests.get(url, headers=headers, params=params)
+                                    res = _session.get(url, headers=headers, params=params)
 
                                 # 재호출 결과 처리
                                 if res.status_code == 200:
@@ -457,17 +463,18 @@ def _wait_for_api_limit():
     """API 호출 속도 제한을 위한 대기"""
     global _last_api_call_time
 
-    current_time = now_kst().timestamp()
+    with _api_limit_lock:
+        current_time = now_kst().timestamp()
 
-    if _last_api_call_time is not None:
-        elapsed = current_time - _last_api_call_time
-        if elapsed < _min_api_interval:
-            wait_time = _min_api_interval - elapsed
-            if _DEBUG:
-                logger.debug(f"API 속도 제한: {wait_time:.3f}초 대기 (이전 호출로부터 {elapsed:.3f}초 경과)")
-            time.sleep(wait_time)
+        if _last_api_call_time is not None:
+            elapsed = current_time - _last_api_call_time
+            if elapsed < _min_api_interval:
+                wait_time = _min_api_interval - elapsed
+                if _DEBUG:
+                    logger.debug(f"API 속도 제한: {wait_time:.3f}초 대기 (이전 호출로부터 {elapsed:.3f}초 경과)")
+                time.sleep(wait_time)
 
-    _last_api_call_time = now_kst().timestamp()
+        _last_api_call_time = now_kst().timestamp()
 
 
 def _is_rate_limit_error(response_text: str) -> bool:
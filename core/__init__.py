@@ -11,7 +11,7 @@ from .enums import (
 from .models import (
     TradingConfig, Position, TradingSignal, TradeRecord,
     AccountSnapshot, MarketData, TechnicalIndicator, RiskMetrics,
-    StrategyConfig, BacktestResult, AlertConfig, SystemStatus, PendingOrder
+    StrategyConfig, BacktestResult, AlertConfig, SystemStatus, PendingOrder, OrderStats
 )
 
 __all__ = [
@@ -22,5 +22,5 @@ __all__ = [
     # 데이터 모델
     'TradingConfig', 'Position', 'TradingSignal', 'TradeRecord',
     'AccountSnapshot', 'MarketData', 'TechnicalIndicator', 'RiskMetrics',
-    'StrategyConfig', 'BacktestResult', 'AlertConfig', 'SystemStatus', 'PendingOrder'
+    'StrategyConfig', 'BacktestResult', 'AlertConfig', 'SystemStatus', 'PendingOrder', 'OrderStats'
 ] 
\ No newline at end of file
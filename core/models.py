@@ -3,11 +3,13 @@
 
 모든 데이터클래스를 중앙에서 관리합니다.
 """
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from enum import Enum
 
+from utils.korean_time import now_kst, is_before_market_open, get_market_open_today
 from .enums import SignalType, OrderType, PositionStatus, TradingMode, RiskLevel, OrderStatus, PatternType
 
 
@@ -37,6 +39,12 @@ class TradingConfig:
     sideways_threshold: float = 0.02  # 횡보 판단 임계값 (2%)
     partial_exit_days: int = 3  # 부분 매도 시작 기간 (일) - 기존 7일 → 3일
     partial_exit_ratio: float = 0.5  # 부분 매도 비율 (50%)
+    
+    # 주문 타입별 체결 확인 간격 (초) - 시장가는 빨리 체결되므로 짧게
+    order_poll_intervals: Dict[OrderType, float] = field(default_factory=lambda: {
+        OrderType.MARKET: 3.0,
+        OrderType.LIMIT: 10.0,
+    })
 
 
 @dataclass
@@ -251,8 +259,26 @@ class PendingOrder:
     retry_count: int = 0
     max_retries: int = 3
     timeout_minutes: int = 3  # 주문 만료 시간 (분)
+    poll_interval_sec: float = 10.0  # 체결 확인 간격 (초, 주문 타입별 설정에서 결정)
+    check_interval_sec: float = 0.0  # 현재 확인 간격 (초, 백오프로 poll_interval_sec까지 증가)
+    next_check_at: float = 0.0  # 다음 체결 확인 시각 (monotonic, 0이면 다음 틱에 바로 확인)
+    confirmed: bool = False  # 주문 조회 결과에서 한 번이라도 확인되었는지 (접수 직후에는 조회에 안 잡힐 수 있음)
     cancel_reason: Optional[str] = None
     previous_filled_quantity: int = 0  # 이전 체결량 (부분 체결 추적용)
+    last_status_sig: Optional[Tuple[Any, ...]] = None  # 직전 조회 상태 시그니처 (변경 없으면 재처리 생략)
+    order_time_monotonic: float = field(default_factory=time.monotonic)  # 경과 시간 계산용 (시계 보정 영향 없음)
+    is_buy: bool = field(init=False)  # 매수 주문 여부 (signal_type 기준, 생성 시 한 번 계산)
+    expires_at: datetime = field(init=False)  # 만료 시각 (생성 시 한 번 계산)
+    
+    def __post_init__(self):
+        self.is_buy = self.signal_type is SignalType.BUY
+        
+        # 장 시작 전 주문은 장 시작 시간(9시)부터, 그 외(테스트 모드 포함)는 주문 시간부터 만료 시간 계산
+        timeout = timedelta(minutes=self.timeout_minutes)
+        if not self.order_data.get('test_mode', False) and is_before_market_open(self.order_time):
+            self.expires_at = get_market_open_today() + timeout
+        else:
+            self.expires_at = self.order_time + timeout
     
     @property
     def is_expired(self) -> bool:
@@ -266,32 +292,25 @@ class PendingOrder:
         - 현재 시간이 장 시작 전(09:00 이전)이면 절대 만료되지 않음
         - 장 시작 후에만 만료 시간 계산을 시작
         """
-        from utils.korean_time import now_kst, is_before_market_open, get_market_open_today
-        
         current_time = now_kst()
-        timeout = timedelta(minutes=self.timeout_minutes)
+        return self.check_expired(current_time, is_before_market_open(current_time))
+    
+    def check_expired(self, current_time: datetime, before_open: bool) -> bool:
+        """
+        기준 시각 기준 만료 여부 확인 (is_expired의 본체)
         
+        Args:
+            current_time: 기준 시각
+            before_open: current_time이 장 시작 전인지 여부 (추적 루프에서 틱 단위로 한 번 계산)
+        """
         # 테스트 모드인지 확인 (메타데이터에서 확인)
         is_test_mode = self.order_data.get('test_mode', False)
         
-        if is_test_mode:
-            # 테스트 모드에서는 기존 로직 사용
-            return (current_time - self.order_time) > timeout
-        
-        # 🔥 핵심 수정: 현재 시간이 장 시작 전이면 절대 만료되지 않음
-        if is_before_market_open(current_time):
+        # 🔥 핵심 수정: 현재 시간이 장 시작 전이면 절대 만료되지 않음 (테스트 모드 제외)
+        if before_open and not is_test_mode:
             return False
         
-        # 🔥 장 시작 후에만 만료 시간 계산
-        # 주문 시간이 장 시작 전이었다면, 장 시작 시간(9시)부터 만료 시간 계산
-        if is_before_market_open(self.order_time):
-            market_open_today = get_market_open_today()
-            elapsed_time = current_time - market_open_today
-        else:
-            # 주문 시간이 장 시작 후였다면, 주문 시간부터 만료 시간 계산
-            elapsed_time = current_time - self.order_time
-        
-        return elapsed_time > timeout
+        return current_time > self.expires_at
     
     @property
     def is_partially_filled(self) -> bool:
@@ -304,6 +323,25 @@ class PendingOrder:
         return self.remaining_quantity == 0 and self.filled_quantity == self.quantity
 
 
+@dataclass(slots=True)
+class OrderStats:
+    """주문 통계 (카운터 증가가 잦으므로 슬롯 기반 필드로 관리)"""
+    total_orders: int = 0
+    successful_orders: int = 0
+    failed_orders: int = 0
+    buy_orders: int = 0
+    sell_orders: int = 0
+    partial_fills: int = 0
+    cancelled_orders: int = 0
+    last_order_time: Optional[datetime] = None
+    
+    @property
+    def success_rate(self) -> float:
+        """주문 성공률 (%) - 조회 시점에 계산"""
+        total_orders = self.total_orders
+        return self.successful_orders / total_orders * 100 if total_orders > 0 else 0.0
+
+
 @dataclass
 class PatternTradingConfig:
     """패턴별 거래 전략 설정"""
@@ -467,6 +467,10 @@ class TradingBot:
                     )
                     self.signal_generator.execute_trading_signals(signals, self.held_stocks, self.account_info)
                 
+                # 8-1. 주문 관련 메시지 일괄 전송
+                if self.order_handler:
+                    self.order_handler.flush_messages()
+                
                 # 9. 하트비트 전송 (10분마다)
                 if self.heartbeat_manager.should_send_heartbeat():
                     self.heartbeat_manager.send_heartbeat(
@@ -5,12 +5,16 @@
 시가총액별 차별화된 목표값 설정과 기술적 지표 필터링을 지원합니다.
 """
 
+import heapq
 import json
+import logging
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional, Callable, Any
 from dataclasses import dataclass
+from enum import IntEnum
+from operator import attrgetter
 
 from api.kis_market_api import get_inquire_daily_itemchartprice, get_stock_market_cap
 from api.kis_auth import KisAuth
@@ -21,6 +25,56 @@ from trading.pattern_detector import PatternDetector, CandleData
 from core.enums import PatternType
 
 
+class _ScanStat(IntEnum):
+    """스캔 필터링 통계 인덱스"""
+    DATA_INSUFFICIENT = 0
+    INDICATOR_FAILED = 1
+    VOLUME_INSUFFICIENT = 2
+    TRADING_VALUE_INSUFFICIENT = 3
+    NO_PATTERN = 4
+    PATTERN_FOUND = 5
+    CONFIDENCE_FAILED = 6
+    VOLUME_RATIO_FAILED = 7
+    TECHNICAL_SCORE_FAILED = 8
+    FINAL_CANDIDATES = 9
+
+
+# _ScanStat 순서와 동일한 통계 로그 라벨
+_SCAN_STAT_LABELS: Tuple[str, ...] = (
+    "데이터 부족",
+    "기술지표 실패",
+    "거래량 부족",
+    "거래대금 부족",
+    "패턴 없음",
+    "패턴 발견",
+    "신뢰도 부족",
+    "거래량비율 부족",
+    "기술점수 부족",
+    "최종 선정",
+)
+
+
+# 필터링 실패 사유 템플릿 (바인딩된 format 메서드로 보관)
+_CONFIDENCE_FAIL_FMT = "신뢰도부족({:.1f}%<{}%)".format
+_VOLUME_FAIL_FMT = "거래량부족({:.1f}배<{}배)".format
+_TECH_SCORE_FAIL_FMT = "기술점수부족({:.1f}점<{}점)".format
+_RSI_FAIL_FMT = "RSI과매수({:.1f}>{})".format
+_RISK_REWARD_FAIL_FMT = "손익비부족(1:{:.1f}<1:{})".format
+_MOMENTUM_COUNT_FAIL_FMT = "모멘텀조건부족({}/4개<2개)".format
+_RS_FAIL_FMT = "상대강도과소({:.1f}%)".format
+_HIGH_52W_FAIL_FMT = "52주신고가과근접({:.1f}%)".format
+_MOMENTUM_FAIL_FMT = "모멘텀과소(5일:{:.1f}%,20일:{:.1f}%)".format
+
+# 패턴 감지 디버그 로그용 (이모지, 패턴명)
+_PATTERN_DETECT_LABELS = {
+    PatternType.MORNING_STAR: ("🌟", "샛별"),
+    PatternType.BULLISH_ENGULFING: ("📈", "상승장악형"),
+    PatternType.THREE_WHITE_SOLDIERS: ("⚔️", "세 백병"),
+    PatternType.ABANDONED_BABY: ("👶", "버려진 아기"),
+    PatternType.HAMMER: ("🔨", "망치형"),
+}
+
+
 @dataclass
 class PatternResult:
     """패턴 감지 결과"""
@@ -38,6 +92,31 @@ class PatternResult:
     confidence: float
 
 
+def _score_momentum(current_price: float, ma20: float, ma60: float,
+                    relative_strength: float, high_52w_ratio: float,
+                    momentum_5d: float, momentum_20d: float) -> Tuple[bool, bool, bool, bool]:
+    """
+    모멘텀 지표 조건 평가 (종목별 스캔 루프의 수치 비교 커널)
+
+    Returns:
+        Tuple[bool, bool, bool, bool]: (이동평균선 근접, 상대강도, 52주 신고가, 단기 모멘텀) 만족 여부
+    """
+    # 1. 이동평균선 근접 조건 강화 (MA20 3% 이내 또는 MA60 7% 이내)
+    ma20_close = ma20 > 0 and abs(current_price - ma20) / current_price <= 0.03
+    ma60_close = ma60 > 0 and abs(current_price - ma60) / current_price <= 0.07
+
+    # 2. 단기 승부용 상대강도 조건 (0% 이상)
+    rs_acceptable = relative_strength >= 0.0
+
+    # 3. 단기 승부용 52주 신고가 대비 위치 조건 (95% 이하, 고점 부근 제외)
+    high_52w_ok = high_52w_ratio <= 95.0
+
+    # 4. 단기 승부용 모멘텀 조건 (5일 또는 20일 수익률 0% 이상)
+    momentum_acceptable = momentum_5d >= 0.0 or momentum_20d >= 0.0
+
+    return (ma20_close or ma60_close), rs_acceptable, high_52w_ok, momentum_acceptable
+
+
 class CandidateScreener:
     """캔들패턴 기반 매수후보 종목 스크리너"""
     
@@ -263,28 +342,23 @@ class CandidateScreener:
             self.logger.warning("주식 리스트가 비어있습니다")
             return []
         
-        candidates = []
+        # 코드/이름이 없는 항목은 스캔 전에 한 번만 걸러냄
+        stock_items = [(stock['code'], stock['name']) for stock in stocks
+                       if stock.get('code') and stock.get('name')]
+        if len(stock_items) < len(stocks):
+            self.logger.warning(f"⚠️ 코드/이름 누락 종목 {len(stocks) - len(stock_items)}개 제외")
+        
+        candidates: List[PatternResult] = []
         processed_count = 0
         pattern_found_count = 0
         filtered_count = 0
         
-        # 필터링 통계
-        stats = {
-            'data_insufficient': 0,
-            'indicator_failed': 0,
-            'volume_insufficient': 0,
-            'trading_value_insufficient': 0,
-            'no_pattern': 0,
-            'pattern_found': 0,
-            'confidence_failed': 0,
-            'volume_ratio_failed': 0,
-            'technical_score_failed': 0,
-            'final_candidates': 0
-        }
+        # 필터링 통계 (_ScanStat 인덱스별 카운터)
+        stats = [0] * len(_ScanStat)
         
         # 오늘자 포함/제외 상태 로그
         today_status = "포함" if include_today else "제외"
-        self.logger.info(f"🔍 총 {len(stocks)}개 종목 매수후보 스캔 시작 (오늘자 데이터: {today_status})")
+        self.logger.info(f"🔍 총 {len(stock_items)}개 종목 매수후보 스캔 시작 (오늘자 데이터: {today_status})")
         self.logger.info(f"🔥 5일 단기 승부 최적화 필터링 조건:")
         self.logger.info(f"   🎯 패턴별 신뢰도: 망치형 75%↑, 상승장악형 75%↑, 샛별 80%↑, 세백병 75%↑, 버려진아기 77%↑")
         self.logger.info(f"   🚀 거래량 증가: 평소 대비 1.5배 이상 (단기 모멘텀 강화)")
@@ -298,59 +372,70 @@ class CandidateScreener:
         self.logger.info(f"     • 52주 신고가: 95% 이하 (고점 부근 제외)")
         self.logger.info(f"     • 단기 모멘텀: 5일 또는 20일 수익률 0% 이상 (강화)")
         
-        for stock in stocks:
+        # 오늘자 제외 기준일 (한국시간, 스캔 단위로 한 번만 계산)
+        current_date_str = now_kst().strftime('%Y%m%d')
+        
+        # 스캔 단위로 DEBUG 레벨 여부 캐싱 (종목별 f-string 생성 회피)
+        self._dbg = self.logger.isEnabledFor(logging.DEBUG)
+        
+        for stock_code, stock_name in stock_items:
             try:
-                stock_code = stock['code']
-                stock_name = stock['name']
-                
                 # 일봉 데이터 조회 (최근 90일)
                 df = self.get_daily_price(stock_code, period=90)
                 if df is None or len(df) < 80:
-                    stats['data_insufficient'] += 1
-                    self.logger.debug(f"❌ {stock_name}({stock_code}): 데이터 부족 (길이: {len(df) if df is not None else 0})")
+                    stats[_ScanStat.DATA_INSUFFICIENT] += 1
+                    if self._dbg:
+                        self.logger.debug(f"❌ {stock_name}({stock_code}): 데이터 부족 (길이: {len(df) if df is not None else 0})")
                     continue
                 
                 # include_today가 False이면 오늘자 데이터 제외
                 if not include_today:
-                    # 현재 날짜 (한국시간)
-                    current_date_str = now_kst().strftime('%Y%m%d')
-                    
-                    # 마지막 데이터의 날짜가 오늘이면 제외
-                    if not df.empty and df.iloc[-1]['date'] == current_date_str:
-                        df = df.iloc[:-1]  # 마지막 행 제거
-                        self.logger.debug(f"📅 {stock_name}({stock_code}): 오늘자 데이터 제외 ({current_date_str})")
+                    # 날짜 오름차순 정렬 상태이므로 이진 탐색으로 오늘자 이전 구간만 슬라이스
+                    end_idx = int(np.searchsorted(df['date'].to_numpy(), current_date_str, side='left'))
+                    if end_idx < len(df):
+                        df = df.iloc[:end_idx]  # 오늘자 행 제거
+                        if self._dbg:
+                            self.logger.debug(f"📅 {stock_name}({stock_code}): 오늘자 데이터 제외 ({current_date_str})")
                     
                     # 데이터 길이 재확인
                     if len(df) < 80:
-                        stats['data_insufficient'] += 1
-                        self.logger.debug(f"❌ {stock_name}({stock_code}): 오늘자 제외 후 데이터 부족 (길이: {len(df)})")
+                        stats[_ScanStat.DATA_INSUFFICIENT] += 1
+                        if self._dbg:
+                            self.logger.debug(f"❌ {stock_name}({stock_code}): 오늘자 제외 후 데이터 부족 (길이: {len(df)})")
                         continue
                 
-                # 캔들 데이터 변환
-                candles = []
-                for _, row in df.iterrows():
-                    candle = CandleData(
-                        date=row['date'],
-                        open_price=row['open'],
-                        high_price=row['high'],
-                        low_price=row['low'],
-                        close_price=row['close'],
-                        volume=row['volume']
+                # 캔들 데이터 변환 (패턴 감지/손절가 계산은 최근 캔들 몇 개만 사용하므로 해당 구간만 객체로 생성)
+                volumes = df['volume'].to_numpy()
+                tail = slice(-PatternDetector.PATTERN_WINDOW, None)
+                candles = [
+                    CandleData(
+                        date=date,
+                        open_price=open_price,
+                        high_price=high_price,
+                        low_price=low_price,
+                        close_price=close_price,
+                        volume=volume
                     )
-                    candles.append(candle)
+                    for date, open_price, high_price, low_price, close_price, volume in zip(
+                        df['date'].to_numpy()[tail].tolist(), df['open'].to_numpy()[tail].tolist(),
+                        df['high'].to_numpy()[tail].tolist(), df['low'].to_numpy()[tail].tolist(),
+                        df['close'].to_numpy()[tail].tolist(), volumes[tail].tolist()
+                    )
+                ]
                 
                 current_price = candles[-1].close_price
                 
                 # 기술적 지표 계산 (필터링된 df 사용)
                 indicators = TechnicalAnalyzer.calculate_technical_indicators(df)
                 if indicators is None:
-                    stats['indicator_failed'] += 1
-                    self.logger.debug(f"❌ {stock_name}({stock_code}): 기술적 지표 계산 실패")
+                    stats[_ScanStat.INDICATOR_FAILED] += 1
+                    if self._dbg:
+                        self.logger.debug(f"❌ {stock_name}({stock_code}): 기술적 지표 계산 실패")
                     continue
                 
                 # 거래량 분석 (필터링된 candles 사용)
                 recent_volume = candles[-1].volume
-                avg_volume = np.mean([c.volume for c in candles[-20:]])
+                avg_volume = volumes[-20:].mean()  # 최근 20일 구간 뷰 (복사 없음)
                 volume_ratio = recent_volume / avg_volume if avg_volume > 0 else 0
                 
                 # 거래대금 계산 (평균 거래대금)
@@ -361,69 +446,50 @@ class CandidateScreener:
                 
                 # 🔧 현실적인 최소 유동성 확보 조건
                 if avg_volume < 20000:  # 일평균 거래량 2만주 미만 (원래대로 복원)
-                    stats['volume_insufficient'] += 1
-                    self.logger.debug(f"❌ {stock_name}({stock_code}): 평균 거래량 부족 ({avg_volume:,.0f}주 < 20,000주)")
+                    stats[_ScanStat.VOLUME_INSUFFICIENT] += 1
+                    if self._dbg:
+                        self.logger.debug(f"❌ {stock_name}({stock_code}): 평균 거래량 부족 ({avg_volume:,.0f}주 < 20,000주)")
                     continue
                 
                 if avg_trading_value < 1.0:  # 일평균 거래대금 10억원 미만 (원래대로 복원)
-                    stats['trading_value_insufficient'] += 1
-                    self.logger.debug(f"❌ {stock_name}({stock_code}): 평균 거래대금 부족 ({avg_trading_value:.2f}억원 < 10억원)")
+                    stats[_ScanStat.TRADING_VALUE_INSUFFICIENT] += 1
+                    if self._dbg:
+                        self.logger.debug(f"❌ {stock_name}({stock_code}): 평균 거래대금 부족 ({avg_trading_value:.2f}억원 < 10억원)")
                     continue
                 
                 # 🔧 최근 거래량 추가 체크 (슬리피지 방지)
                 if recent_trading_value < 0.3:  # 최근 거래대금 3억원 미만 (원래대로 복원)
-                    stats['trading_value_insufficient'] += 1
-                    self.logger.debug(f"❌ {stock_name}({stock_code}): 최근 거래대금 부족 ({recent_trading_value:.2f}억원 < 3억원)")
+                    stats[_ScanStat.TRADING_VALUE_INSUFFICIENT] += 1
+                    if self._dbg:
+                        self.logger.debug(f"❌ {stock_name}({stock_code}): 최근 거래대금 부족 ({recent_trading_value:.2f}억원 < 3억원)")
                     continue
                 
                 # 패턴 감지 (TOP 5 패턴 검사) - 필터링된 candles 사용
-                patterns_found = []
-                
-                # 1. 샛별 패턴 검사 (신뢰도 95%+)
-                is_morning_star, morning_star_strength = PatternDetector.detect_morning_star_pattern(candles)
-                if is_morning_star:
-                    patterns_found.append((PatternType.MORNING_STAR, morning_star_strength))
-                    self.logger.debug(f"🌟 {stock_name}({stock_code}): 샛별 패턴 감지 (강도: {morning_star_strength:.2f})")
-                
-                # 2. 상승장악형 패턴 검사 (신뢰도 90%+)
-                is_engulfing, engulfing_strength = PatternDetector.detect_bullish_engulfing_pattern(candles)
-                if is_engulfing:
-                    patterns_found.append((PatternType.BULLISH_ENGULFING, engulfing_strength))
-                    self.logger.debug(f"📈 {stock_name}({stock_code}): 상승장악형 패턴 감지 (강도: {engulfing_strength:.2f})")
-                
-                # 3. 세 백병 패턴 검사 (신뢰도 85%+)
-                is_three_soldiers, three_soldiers_strength = PatternDetector.detect_three_white_soldiers_pattern(candles)
-                if is_three_soldiers:
-                    patterns_found.append((PatternType.THREE_WHITE_SOLDIERS, three_soldiers_strength))
-                    self.logger.debug(f"⚔️ {stock_name}({stock_code}): 세 백병 패턴 감지 (강도: {three_soldiers_strength:.2f})")
-                
-                # 4. 버려진 아기 패턴 검사 (신뢰도 90%+)
-                is_abandoned_baby, abandoned_baby_strength = PatternDetector.detect_abandoned_baby_pattern(candles)
-                if is_abandoned_baby:
-                    patterns_found.append((PatternType.ABANDONED_BABY, abandoned_baby_strength))
-                    self.logger.debug(f"👶 {stock_name}({stock_code}): 버려진 아기 패턴 감지 (강도: {abandoned_baby_strength:.2f})")
-                
-                # 5. 망치형 패턴 검사 (신뢰도 75%+)
-                is_hammer, hammer_strength = PatternDetector.detect_hammer_pattern(candles)
-                if is_hammer:
-                    patterns_found.append((PatternType.HAMMER, hammer_strength))
-                    self.logger.debug(f"🔨 {stock_name}({stock_code}): 망치형 패턴 감지 (강도: {hammer_strength:.2f})")
+                # 샛별 → 상승장악형 → 세 백병 → 버려진 아기 → 망치형 순으로 한 번에 검사
+                patterns_found = list(PatternDetector.scan_all(candles).items())
+                if self._dbg:
+                    for pattern_type, pattern_strength in patterns_found:
+                        emoji, pattern_label = _PATTERN_DETECT_LABELS[pattern_type]
+                        self.logger.debug(f"{emoji} {stock_name}({stock_code}): {pattern_label} 패턴 감지 (강도: {pattern_strength:.2f})")
                 
                 if not patterns_found:
-                    stats['no_pattern'] += 1
-                    self.logger.debug(f"⚪ {stock_name}({stock_code}): 패턴 없음")
+                    stats[_ScanStat.NO_PATTERN] += 1
+                    if self._dbg:
+                        self.logger.debug(f"⚪ {stock_name}({stock_code}): 패턴 없음")
                 
                 # 패턴이 발견된 경우 후보로 추가
+                candle_dicts = None
                 for pattern_type, pattern_strength in patterns_found:
                     pattern_found_count += 1
-                    stats['pattern_found'] += 1
+                    stats[_ScanStat.PATTERN_FOUND] += 1
                     
                     # 시가총액 정보 (실제 API 조회)
                     market_cap_info = self.get_market_cap_info(stock_code)
                     if market_cap_info:
                         actual_market_cap = market_cap_info['market_cap']
                         market_cap_type = TechnicalAnalyzer.get_market_cap_type(actual_market_cap)
-                        self.logger.debug(f"💰 {stock_name}({stock_code}): 시가총액 {actual_market_cap:,.0f}억원 ({market_cap_type.value})")
+                        if self._dbg:
+                            self.logger.debug(f"💰 {stock_name}({stock_code}): 시가총액 {actual_market_cap:,.0f}억원 ({market_cap_type.value})")
                     else:
                         # API 조회 실패 시 임시 추정값 사용
                         estimated_market_cap = current_price * 1000000
@@ -445,18 +511,19 @@ class CandidateScreener:
                         technical_score=technical_score  # 기술점수
                     )
                     
-                    # 캔들 데이터를 딕셔너리 형태로 변환
-                    candle_dicts = []
-                    for candle in candles:
-                        candle_dict = {
-                            'date': candle.date,
-                            'open_price': candle.open_price,
-                            'high_price': candle.high_price,
-                            'low_price': candle.low_price,
-                            'close_price': candle.close_price,
-                            'volume': candle.volume
-                        }
-                        candle_dicts.append(candle_dict)
+                    # 캔들 데이터를 딕셔너리 형태로 변환 (종목당 1회)
+                    if candle_dicts is None:
+                        candle_dicts = [
+                            {
+                                'date': candle.date,
+                                'open_price': candle.open_price,
+                                'high_price': candle.high_price,
+                                'low_price': candle.low_price,
+                                'close_price': candle.close_price,
+                                'volume': candle.volume
+                            }
+                            for candle in candles
+                        ]
                     
                     # 패턴별 손절매 계산
                     stop_loss = TechnicalAnalyzer.calculate_pattern_stop_loss(
@@ -480,25 +547,26 @@ class CandidateScreener:
                         PatternType.HAMMER: "망치형"
                     }
                     pattern_name = pattern_names.get(pattern_type, "알 수 없음")
-                    self.logger.debug(f"📊 {stock_name}({stock_code}) {pattern_name}:")
-                    self.logger.debug(f"   현재가: {current_price:,.0f}원")
-                    self.logger.debug(f"   목표가: {target_price:,.0f}원 ({(target_price/current_price-1)*100:.1f}%)")
-                    self.logger.debug(f"   손절가: {stop_loss:,.0f}원 ({(stop_loss/current_price-1)*100:.1f}%)")
-                    self.logger.debug(f"   신뢰도: {confidence:.1f}%")
-                    self.logger.debug(f"   거래량: {volume_ratio:.1f}배 (평균: {avg_volume:,.0f}주, 최근: {recent_volume:,.0f}주)")
-                    self.logger.debug(f"   거래대금: 평균 {avg_trading_value:.1f}억원, 최근 {recent_trading_value:.1f}억원")
-                    self.logger.debug(f"   기술점수: {technical_score:.1f}점")
-                    self.logger.debug(f"   RSI: {indicators.rsi:.1f}")
-                    
-                    # 🚀 모멘텀 지표 로그 추가
-                    self.logger.debug(f"   🚀 모멘텀 지표:")
-                    self.logger.debug(f"     MA20 근접: {'✅' if abs(current_price - indicators.ma20) / current_price <= 0.05 else '❌'}")
-                    self.logger.debug(f"     MA60 근접: {'✅' if abs(current_price - indicators.ma60) / current_price <= 0.10 else '❌'}")
-                    self.logger.debug(f"     상대강도: {indicators.relative_strength:.1f}%")
-                    self.logger.debug(f"     52주 신고가 대비: {indicators.high_52w_ratio:.1f}%")
-                    self.logger.debug(f"     5일 모멘텀: {indicators.momentum_5d:.1f}%")
-                    self.logger.debug(f"     20일 모멘텀: {indicators.momentum_20d:.1f}%")
-                    
+                    if self._dbg:
+                        self.logger.debug(f"📊 {stock_name}({stock_code}) {pattern_name}:")
+                        self.logger.debug(f"   현재가: {current_price:,.0f}원")
+                        self.logger.debug(f"   목표가: {target_price:,.0f}원 ({(target_price/current_price-1)*100:.1f}%)")
+                        self.logger.debug(f"   손절가: {stop_loss:,.0f}원 ({(stop_loss/current_price-1)*100:.1f}%)")
+                        self.logger.debug(f"   신뢰도: {confidence:.1f}%")
+                        self.logger.debug(f"   거래량: {volume_ratio:.1f}배 (평균: {avg_volume:,.0f}주, 최근: {recent_volume:,.0f}주)")
+                        self.logger.debug(f"   거래대금: 평균 {avg_trading_value:.1f}억원, 최근 {recent_trading_value:.1f}억원")
+                        self.logger.debug(f"   기술점수: {technical_score:.1f}점")
+                        self.logger.debug(f"   RSI: {indicators.rsi:.1f}")
+                        
+                        # 🚀 모멘텀 지표 로그 추가
+                        self.logger.debug(f"   🚀 모멘텀 지표:")
+                        self.logger.debug(f"     MA20 근접: {'✅' if abs(current_price - indicators.ma20) / current_price <= 0.05 else '❌'}")
+                        self.logger.debug(f"     MA60 근접: {'✅' if abs(current_price - indicators.ma60) / current_price <= 0.10 else '❌'}")
+                        self.logger.debug(f"     상대강도: {indicators.relative_strength:.1f}%")
+                        self.logger.debug(f"     52주 신고가 대비: {indicators.high_52w_ratio:.1f}%")
+                        self.logger.debug(f"     5일 모멘텀: {indicators.momentum_5d:.1f}%")
+                        self.logger.debug(f"     20일 모멘텀: {indicators.momentum_20d:.1f}%")
+                        
                     # 🔥 완화된 패턴별 차별화 필터링 조건
                     pattern_config = TechnicalAnalyzer.get_pattern_config(pattern_type)
                     required_volume_ratio = pattern_config.volume_multiplier if pattern_config else 1.2
@@ -533,24 +601,19 @@ class CandidateScreener:
                         risk_reward_ratio = 0
                         min_risk_reward_ratio = 2.0
                     
-                    # 🚀 단기 승부용 강화된 모멘텀 지표 필터링 조건
-                    # 1. 이동평균선 근접 조건 강화
-                    ma20_close = abs(current_price - indicators.ma20) / current_price <= 0.03 if indicators.ma20 > 0 else False  # 5% → 3%로 강화
-                    ma60_close = abs(current_price - indicators.ma60) / current_price <= 0.07 if indicators.ma60 > 0 else False  # 10% → 7%로 강화
-                    ma_close_condition = ma20_close or ma60_close
-                    
-                    # 2. 단기 승부용 상대강도 조건 강화
-                    rs_acceptable = indicators.relative_strength >= 0.0  # -2% → 0% 이상으로 강화
-                    
-                    # 3. 단기 승부용 52주 신고가 대비 위치 조건 강화
-                    high_52w_ok = indicators.high_52w_ratio <= 95.0  # 99% → 95%로 강화 (고점 부근 제외)
-                    
-                    # 4. 단기 승부용 모멘텀 조건 강화
-                    momentum_acceptable = indicators.momentum_5d >= 0.0 or indicators.momentum_20d >= 0.0  # -3% → 0% 이상으로 강화
-                    
+                    # 🚀 단기 승부용 강화된 모멘텀 지표 필터링 조건 (수치 비교는 _score_momentum 커널에서 수행)
+                    ma_close_condition, rs_acceptable, high_52w_ok, momentum_acceptable = _score_momentum(
+                        current_price,
+                        indicators.ma20,
+                        indicators.ma60,
+                        indicators.relative_strength,
+                        indicators.high_52w_ratio,
+                        indicators.momentum_5d,
+                        indicators.momentum_20d
+                    )
+
                     # 🔧 단기 승부용 모멘텀 조건 강화 (4개 중 3개 이상 만족)
-                    momentum_conditions = [ma_close_condition, rs_acceptable, high_52w_ok, momentum_acceptable]
-                    momentum_pass_count = sum(momentum_conditions)
+                    momentum_pass_count = ma_close_condition + rs_acceptable + high_52w_ok + momentum_acceptable
                     momentum_criteria_met = momentum_pass_count >= 2  # 2개 → 3개로 강화 (더 확실한 신호만)
                     
                     if (confidence >= min_confidence and           # 완화된 패턴별 신뢰도
@@ -561,7 +624,7 @@ class CandidateScreener:
                         momentum_criteria_met):                   # 완화된 모멘텀 조건 (4개 중 2개 이상)
                         
                         filtered_count += 1
-                        stats['final_candidates'] += 1
+                        stats[_ScanStat.FINAL_CANDIDATES] += 1
                         
                         candidate = PatternResult(
                             stock_code=stock_code,
@@ -585,46 +648,55 @@ class CandidateScreener:
                                        f"손익비: 1:{risk_reward_ratio:.1f}, "
                                        f"모멘텀: {momentum_pass_count}/4개 만족)")
                     else:
-                        # 🔍 상세한 필터링 실패 사유 로그 및 통계
-                        failed_reasons = []
+                        # 🔍 필터링 실패 통계
                         if confidence < min_confidence:
-                            failed_reasons.append(f"신뢰도부족({confidence:.1f}%<{min_confidence}%)")
-                            stats['confidence_failed'] += 1
+                            stats[_ScanStat.CONFIDENCE_FAILED] += 1
                         if volume_ratio < min_volume_ratio:
-                            failed_reasons.append(f"거래량부족({volume_ratio:.1f}배<{min_volume_ratio}배)")
-                            stats['volume_ratio_failed'] += 1
+                            stats[_ScanStat.VOLUME_RATIO_FAILED] += 1
                         if technical_score < min_technical_score:
-                            failed_reasons.append(f"기술점수부족({technical_score:.1f}점<{min_technical_score}점)")
-                            stats['technical_score_failed'] += 1
+                            stats[_ScanStat.TECHNICAL_SCORE_FAILED] += 1
                         if indicators.rsi > max_rsi:
-                            failed_reasons.append(f"RSI과매수({indicators.rsi:.1f}>{max_rsi})")
-                            stats['technical_score_failed'] += 1  # RSI도 기술점수 실패로 분류
+                            stats[_ScanStat.TECHNICAL_SCORE_FAILED] += 1  # RSI도 기술점수 실패로 분류
                         if risk_reward_ratio < min_risk_reward_ratio:
-                            failed_reasons.append(f"손익비부족(1:{risk_reward_ratio:.1f}<1:{min_risk_reward_ratio})")
-                            stats['technical_score_failed'] += 1  # 손익비도 기술점수 실패로 분류
-                        
-                        # 🚀 모멘텀 지표 실패 사유 추가
+                            stats[_ScanStat.TECHNICAL_SCORE_FAILED] += 1  # 손익비도 기술점수 실패로 분류
                         if not momentum_criteria_met:
-                            failed_reasons.append(f"모멘텀조건부족({momentum_pass_count}/4개<2개)")
-                            stats['technical_score_failed'] += 1
-                            # 세부 조건 추가 로그
-                            momentum_details = []
-                            if not ma_close_condition:
-                                momentum_details.append("이동평균선원거리")
-                            if not rs_acceptable:
-                                momentum_details.append(f"상대강도과소({indicators.relative_strength:.1f}%)")
-                            if not high_52w_ok:
-                                momentum_details.append(f"52주신고가과근접({indicators.high_52w_ratio:.1f}%)")
-                            if not momentum_acceptable:
-                                momentum_details.append(f"모멘텀과소(5일:{indicators.momentum_5d:.1f}%,20일:{indicators.momentum_20d:.1f}%)")
-                            if momentum_details:
-                                failed_reasons.append(f"({', '.join(momentum_details)})")
+                            stats[_ScanStat.TECHNICAL_SCORE_FAILED] += 1
                         
-                        self.logger.debug(f"❌ {stock_name}({stock_code}) {pattern_name}: 5일 단기 승부 필터링 실패 - {', '.join(failed_reasons)}")
+                        # 🔍 상세한 필터링 실패 사유 로그 (DEBUG 레벨에서만 문자열 생성)
+                        if self._dbg:
+                            failed_reasons = []
+                            if confidence < min_confidence:
+                                failed_reasons.append(_CONFIDENCE_FAIL_FMT(confidence, min_confidence))
+                            if volume_ratio < min_volume_ratio:
+                                failed_reasons.append(_VOLUME_FAIL_FMT(volume_ratio, min_volume_ratio))
+                            if technical_score < min_technical_score:
+                                failed_reasons.append(_TECH_SCORE_FAIL_FMT(technical_score, min_technical_score))
+                            if indicators.rsi > max_rsi:
+                                failed_reasons.append(_RSI_FAIL_FMT(indicators.rsi, max_rsi))
+                            if risk_reward_ratio < min_risk_reward_ratio:
+                                failed_reasons.append(_RISK_REWARD_FAIL_FMT(risk_reward_ratio, min_risk_reward_ratio))
+                            
+                            # 🚀 모멘텀 지표 실패 사유 추가
+                            if not momentum_criteria_met:
+                                failed_reasons.append(_MOMENTUM_COUNT_FAIL_FMT(momentum_pass_count))
+                                # 세부 조건 추가 로그
+                                momentum_details = []
+                                if not ma_close_condition:
+                                    momentum_details.append("이동평균선원거리")
+                                if not rs_acceptable:
+                                    momentum_details.append(_RS_FAIL_FMT(indicators.relative_strength))
+                                if not high_52w_ok:
+                                    momentum_details.append(_HIGH_52W_FAIL_FMT(indicators.high_52w_ratio))
+                                if not momentum_acceptable:
+                                    momentum_details.append(_MOMENTUM_FAIL_FMT(indicators.momentum_5d, indicators.momentum_20d))
+                                if momentum_details:
+                                    failed_reasons.append("(" + ", ".join(momentum_details) + ")")
+                            
+                            self.logger.debug(f"❌ {stock_name}({stock_code}) {pattern_name}: 5일 단기 승부 필터링 실패 - {', '.join(failed_reasons)}")
                 
                 processed_count += 1
                 if processed_count % 100 == 0:
-                    self.logger.info(f"📈 진행률: {processed_count}/{len(stocks)} ({processed_count/len(stocks)*100:.1f}%) - "
+                    self.logger.info(f"📈 진행률: {processed_count}/{len(stock_items)} ({processed_count/len(stock_items)*100:.1f}%) - "
                                    f"패턴발견: {pattern_found_count}, 후보선정: {len(candidates)}")
                 
                 # 제한 수량 도달 시 중단
@@ -633,31 +705,23 @@ class CandidateScreener:
                     break
                     
             except Exception as e:
-                self.logger.error(f"❌ 종목 {stock.get('name', 'Unknown')}({stock.get('code', 'Unknown')}) 처리 실패: {e}")
+                self.logger.error(f"❌ 종목 {stock_name}({stock_code}) 처리 실패: {e}")
                 continue
         
-        # 신뢰도 순으로 정렬
-        candidates.sort(key=lambda x: x.confidence, reverse=True)
+        # 신뢰도 상위 limit개만 선별 (전체 정렬 대신 부분 힙 선택)
+        candidates = heapq.nlargest(limit, candidates, key=attrgetter('confidence'))
         
         # 최종 결과 로그
         self.logger.info(f"🎯 스캔 완료! (오늘자 데이터: {today_status})")
-        self.logger.info(f"   처리된 종목: {processed_count}/{len(stocks)}개")
+        self.logger.info(f"   처리된 종목: {processed_count}/{len(stock_items)}개")
         self.logger.info(f"   패턴 발견: {pattern_found_count}개")
         self.logger.info(f"   필터링 통과: {filtered_count}개")
         self.logger.info(f"   최종 후보: {len(candidates)}개")
         
         # 상세 필터링 통계
         self.logger.info(f"📊 필터링 통계:")
-        self.logger.info(f"   데이터 부족: {stats['data_insufficient']}개")
-        self.logger.info(f"   기술지표 실패: {stats['indicator_failed']}개")
-        self.logger.info(f"   거래량 부족: {stats['volume_insufficient']}개")
-        self.logger.info(f"   거래대금 부족: {stats['trading_value_insufficient']}개")
-        self.logger.info(f"   패턴 없음: {stats['no_pattern']}개")
-        self.logger.info(f"   패턴 발견: {stats['pattern_found']}개")
-        self.logger.info(f"   신뢰도 부족: {stats['confidence_failed']}개")
-        self.logger.info(f"   거래량비율 부족: {stats['volume_ratio_failed']}개")
-        self.logger.info(f"   기술점수 부족: {stats['technical_score_failed']}개")
-        self.logger.info(f"   최종 선정: {stats['final_candidates']}개")
+        for stat, label in zip(_ScanStat, _SCAN_STAT_LABELS):
+            self.logger.info(f"   {label}: {stats[stat]}개")
         
         if candidates:
             self.logger.info(f"🥇 최고 신뢰도: {candidates[0].stock_name}({candidates[0].stock_code}) - {candidates[0].confidence:.1f}%")
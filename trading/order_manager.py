@@ -3,17 +3,85 @@
 
 매수/매도 주문 실행 및 관리를 담당합니다.
 """
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Set, Tuple, Deque, Mapping
+from types import MappingProxyType
+from collections import deque
+from functools import lru_cache
+from operator import itemgetter
 from datetime import datetime, timedelta
+import heapq
+import logging
 import queue
+import time
 import asyncio
 import threading
 
 from api.kis_api_manager import KISAPIManager, OrderResult
-from core.models import TradingSignal, TradingConfig, Position, TradeRecord, PendingOrder
+from core.models import TradingSignal, TradingConfig, Position, TradeRecord, PendingOrder, OrderStats
 from core.enums import SignalType, OrderType, OrderStatus, MessageType
 from utils.logger import setup_logger
-from utils.korean_time import now_kst
+from utils.korean_time import now_kst, is_before_market_open, get_market_open_today
+
+
+# 더 이상 체결 확인이 필요 없는 주문 상태
+_TERMINAL_STATUSES = frozenset({OrderStatus.FILLED, OrderStatus.CANCELLED})
+# 아직 체결될 수 있는(잔량이 남은) 주문 상태
+_ACTIVE_STATUSES = frozenset({OrderStatus.PENDING, OrderStatus.PARTIAL_FILLED})
+
+# 자주 비교하는 열거형 멤버 (열거형 멤버는 싱글턴이므로 is 비교)
+_BUY = SignalType.BUY
+_SELL = SignalType.SELL
+
+# 주문 상태 조회 결과에서 사용하는 필드 (체결/잔여/주문/취소여부/취소확인수량)
+_STATUS_KEYS = ('tot_ccld_qty', 'rmn_qty', 'ord_qty', 'cncl_yn', 'cnc_cfrm_qty')
+_STATUS_DEFAULTS = ('0', '0', '0', 'N', '0')
+_STATUS_FIELDS = itemgetter(*_STATUS_KEYS)
+
+# 체결 확인 간격 (초): 타입별 설정이 없을 때 기본값 / 최소값 (API 호출 한도 보호)
+_DEFAULT_POLL_INTERVAL = 10.0
+_MIN_POLL_INTERVAL = 1.0
+# 신규/상태 변경 직후 주문의 첫 확인 간격 (초), 변동이 없으면 타입별 확인 간격까지 2배씩 늘림
+_INITIAL_CHECK_INTERVAL = 2.0
+# 만료 처리 후에도 남아 있는 주문(취소 실패, 장 시작 전 대기 등)의 만료 재확인 간격
+_EXPIRY_RETRY_DELAY = timedelta(seconds=5)
+
+# 접수 직후 주문 조회에 아직 나타나지 않은 주문을 '상태 불명'으로 처리하지 않고 기다리는 시간 (초)
+_UNCONFIRMED_GRACE_SEC = 30.0
+
+# 매수 여부 → 로그/알림용 표시 문자열
+_SIDE_LABELS = {True: '매수', False: '매도'}
+
+
+# 만료 주문 최종 확인 시 체결 상태 분류 코드
+_FILL_NONE = 0        # 미체결
+_FILL_PARTIAL = 1     # 부분 체결
+_FILL_FULL = 2        # 완전 체결
+_FILL_CANCELLED = 3   # 이미 취소됨
+_FILL_UNKNOWN = 4     # 그 외 (체결량이 주문량 초과 등)
+
+
+def _classify_fill(filled_qty: int, order_qty: int, cancelled: str) -> int:
+    """체결 상태 분류 (체결 여부를 취소 여부보다 먼저 판정)"""
+    if filled_qty > 0:
+        if filled_qty == order_qty:
+            return _FILL_FULL
+        if filled_qty < order_qty:
+            return _FILL_PARTIAL
+    if cancelled == 'Y':
+        return _FILL_CANCELLED
+    if filled_qty == 0:
+        return _FILL_NONE
+    return _FILL_UNKNOWN
+
+
+@lru_cache(maxsize=4096)
+def _parse_qty(raw: str) -> int:
+    """수량 문자열 변환 (쉼표 제거, 폴링마다 같은 값이 반복되므로 캐싱)"""
+    return int(float(raw.replace(',', '')))
+
+
+def _noop_account_update(trade_amount: float, is_buy: bool) -> None:
+    """계좌 업데이트 콜백 기본값 (콜백 미등록 시 아무 작업도 하지 않음)"""
 
 
 class OrderManager:
@@ -33,8 +101,8 @@ class OrderManager:
         self.config = config
         self.message_queue = message_queue
         
-        # 계좌 정보 업데이트 콜백
-        self.account_update_callback: Optional[Callable[[float, bool], None]] = None
+        # 계좌 정보 업데이트 콜백 (미등록 시 no-op 기본값으로 호출부 분기 제거)
+        self.account_update_callback: Callable[[float, bool], None] = _noop_account_update
         
         # 보유 종목 업데이트 콜백 (매수/매도 체결 시 held_stocks 업데이트용)
         self.held_stocks_update_callback: Optional[Callable[[str, str, int, float, bool, Optional[Dict[str, Any]]], None]] = None
@@ -44,20 +112,34 @@ class OrderManager:
         
         # 주문 추적 관리
         self.pending_orders: Dict[str, PendingOrder] = {}  # 대기 중인 주문들
+        self._active_orders: Dict[str, PendingOrder] = {}  # 그중 체결 완료/취소 전인 주문 (체결 확인 대상)
+        self._pending_sell_ids_by_code: Dict[str, Set[str]] = {}  # 종목별 대기 매도 주문 ID
+        # 대기 주문 목록/인덱스 보호용 (추적 스레드와 매매 스레드가 동시에 접근)
+        self._pending_lock = threading.Lock()
         self.order_tracking_active = False
         self.tracking_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()  # 추적 루프 대기/즉시 종료용
+        # 대기 주문 만료 시각 힙 ((만료 시각, 주문 ID), 가장 이른 만료가 맨 앞)
+        self._deadline_heap: List[Tuple[datetime, str]] = []
+        # 만료 취소되어 정리 대기 중인 주문 (취소 시각 순, (monotonic 시각, 주문 ID), 완전 체결 주문은 즉시 제거)
+        self._terminal_queue: Deque[Tuple[float, str]] = deque()
+        # get_pending_orders용 읽기 전용 스냅샷 (대기 주문 추가/제거 시 무효화)
+        self._pending_snapshot: Optional[Mapping[str, PendingOrder]] = None
+        # 주문 추적 상태 조회 캐시 (대기 주문 추가/제거/상태 반영 시 무효화)
+        self._tracking_status_dirty = True
+        self._tracking_status_cache: List[Tuple[Dict[str, Any], float]] = []
+        
+        # 메시지 버퍼 (메시지 큐 잠금 횟수를 줄이기 위해 모아서 전송)
+        self._msg_buffer: List[str] = []
+        self._msg_buffer_max = 16
+        self._msg_max_delay = 0.1  # 버퍼의 첫 메시지가 이 시간(초) 이상 대기하면 다음 전송 시 즉시 flush
+        self._msg_buffer_since = 0.0
+        self._msg_lock = threading.Lock()
         
         # 주문 통계
-        self.order_stats = {
-            'total_orders': 0,
-            'successful_orders': 0,
-            'failed_orders': 0,
-            'buy_orders': 0,
-            'sell_orders': 0,
-            'partial_fills': 0,
-            'cancelled_orders': 0,
-            'last_order_time': None
-        }
+        self.order_stats = OrderStats()
+        # 주문 통계/오늘 매수 종목 보호용 (주문 호출 스레드와 추적 스레드가 동시에 갱신)
+        self._bookkeeping_lock = threading.Lock()
         
         self.logger.info("✅ OrderManager 초기화 완료")
     
@@ -83,7 +165,8 @@ class OrderManager:
         Args:
             today_buy_stocks: 오늘 매수한 종목 코드 리스트
         """
-        self.today_buy_stocks = today_buy_stocks.copy()
+        with self._bookkeeping_lock:
+            self.today_buy_stocks = today_buy_stocks.copy()
         self.logger.debug(f"📊 오늘 매수한 종목 목록 설정: {len(self.today_buy_stocks)}개")
     
     def is_today_buy_stock(self, stock_code: str) -> bool:
@@ -96,7 +179,8 @@ class OrderManager:
         Returns:
             bool: 오늘 매수한 종목 여부
         """
-        return stock_code in self.today_buy_stocks
+        with self._bookkeeping_lock:
+            return stock_code in self.today_buy_stocks
     
     def add_today_buy_stock(self, stock_code: str) -> None:
         """
@@ -105,7 +189,9 @@ class OrderManager:
         Args:
             stock_code: 종목 코드
         """
-        if stock_code not in self.today_buy_stocks:
+        with self._bookkeeping_lock:
+            if stock_code in self.today_buy_stocks:
+                return
             self.today_buy_stocks.append(stock_code)
             self.logger.debug(f"📝 OrderManager 오늘 매수 종목 추가: {stock_code}")
     
@@ -122,6 +208,7 @@ class OrderManager:
         Returns:
             OrderResult: 주문 결과
         """
+        ts = now_kst()  # 주문 처리 기준 시각 (결과 처리/대기 등록에 공유)
         try:
             # 1. 사전 검증
             if not self._validate_buy_order(signal, positions, account_info):
@@ -132,6 +219,10 @@ class OrderManager:
                 self.logger.warning(f"⚠️ 매수 수량 없음: {signal.stock_name}")
                 return None
             
+            if signal.price <= 0:
+                self.logger.warning(f"⚠️ 매수 가격 오류: {signal.stock_name} ({signal.price})")
+                return None
+            
             # 3. 주문 실행
             order_result = self.api_manager.place_buy_order(
                 stock_code=signal.stock_code,
@@ -140,17 +231,17 @@ class OrderManager:
             )
             
             # 4. 결과 처리
-            self._process_buy_order_result(signal, order_result, signal.quantity)
+            self._process_buy_order_result(signal, order_result, signal.quantity, ts=ts)
             
             # 5. 성공한 주문을 대기 목록에 추가
             if order_result and order_result.success:
-                self.add_pending_order(order_result, signal)
+                self.add_pending_order(order_result, signal, ts=ts)
             
             return order_result
             
         except Exception as e:
             self.logger.error(f"❌ 매수 주문 실행 오류: {e}")
-            self._send_message(f"❌ 매수 주문 실행 오류: {e}")
+            self._send_message(f"❌ 매수 주문 실행 오류: {e}", ts=ts, urgent=True)
             return None
     
     def execute_sell_order(self, signal: TradingSignal, positions: Dict[str, Position]) -> Optional[OrderResult]:
@@ -164,6 +255,7 @@ class OrderManager:
         Returns:
             OrderResult: 주문 결과
         """
+        ts = now_kst()  # 주문 처리 기준 시각 (결과 처리/대기 등록에 공유)
         try:
             # 1. 사전 검증
             if not self._validate_sell_order(signal, positions):
@@ -199,168 +291,225 @@ class OrderManager:
             )
             
             # 4. 결과 처리
-            self._process_sell_order_result(signal, order_result, sell_quantity, position)
+            self._process_sell_order_result(signal, order_result, sell_quantity, position, ts=ts)
             
             # 5. 성공한 주문을 대기 목록에 추가
             if order_result and order_result.success:
                 # 🔍 실제 주문 수량으로 신호 업데이트
                 signal.quantity = sell_quantity
-                self.add_pending_order(order_result, signal)
+                self.add_pending_order(order_result, signal, ts=ts)
             
             return order_result
             
         except Exception as e:
             self.logger.error(f"❌ 매도 주문 실행 오류: {e}")
-            self._send_message(f"❌ 매도 주문 실행 오류: {e}")
+            self._send_message(f"❌ 매도 주문 실행 오류: {e}", ts=ts, urgent=True)
             return None
     
     
+    def execute_signals(self, signals: List[TradingSignal], positions: Dict[str, Position],
+                        account_info: Any) -> List[Tuple[TradingSignal, Optional[OrderResult]]]:
+        """
+        매매 신호 일괄 주문 (호출 스레드에서 신호 순서대로 전송)
+        
+        주문 API 호출은 속도 제한으로 어차피 직렬화되고 인증 토큰 갱신이 스레드 안전하지 않으므로
+        매수/매도 모두 순서대로 처리합니다. 매수는 계좌 반영이 다음 매수 검증보다 먼저 끝나야 합니다.
+        
+        Args:
+            signals: 실행할 매매 신호 목록
+            positions: 현재 포지션
+            account_info: 계좌 정보
+            
+        Returns:
+            List[Tuple[TradingSignal, Optional[OrderResult]]]: 신호 순서대로의 (신호, 주문 결과)
+        """
+        results: List[Tuple[TradingSignal, Optional[OrderResult]]] = []
+        for signal in signals:
+            if signal.signal_type is _BUY:
+                order_result = self.execute_buy_order(signal, positions, account_info)
+            elif signal.signal_type is _SELL:
+                order_result = self.execute_sell_order(signal, positions)
+            else:
+                continue
+            results.append((signal, order_result))
+        return results
+    
     def _validate_buy_order(self, signal: TradingSignal, positions: Dict[str, Position], 
                            account_info: Any) -> bool:
         """매수 주문 검증"""
-        try:
-            # 계좌 정보 확인
-            if not account_info:
-                self.logger.warning("⚠️ 계좌 정보 없음")
-                return False
-            
-            # 매수 가능 금액 확인 (최소 투자 금액)
-            min_investment = account_info.total_value * self.config.min_position_ratio
-            if account_info.available_amount < min_investment:
-                self.logger.warning(f"⚠️ 매수 가능 금액 부족: {account_info.available_amount:,.0f}원 "
-                                   f"(최소 필요: {min_investment:,.0f}원)")
-                return False
-            
-            # 포지션 수 확인
-            if len(positions) >= self.config.max_position_count:
-                self.logger.warning(f"⚠️ 최대 포지션 수 초과: {len(positions)}/{self.config.max_position_count}")
-                return False
-            
-            # 중복 포지션 확인
-            if signal.stock_code in positions:
-                self.logger.warning(f"⚠️ 이미 보유 중인 종목: {signal.stock_name}")
-                return False
-            
-            # 🚨 핵심 추가: 오늘 매수한 종목 중복 매수 방지
-            if self.is_today_buy_stock(signal.stock_code):
-                self.logger.warning(f"🚫 오늘 이미 매수한 종목: {signal.stock_name} ({signal.stock_code})")
-                self._send_message(f"🚫 {signal.stock_name}: 오늘 이미 매수한 종목입니다")
-                return False
-            else:
-                self.logger.debug(f"✅ 오늘 매수하지 않은 종목: {signal.stock_name} ({signal.stock_code})")
-            
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"❌ 매수 주문 검증 오류: {e}")
+        # 계좌 정보 확인
+        if not account_info:
+            self.logger.warning("⚠️ 계좌 정보 없음")
+            return False
+        
+        # 매수 가능 금액 확인 (최소 투자 금액)
+        min_investment = account_info.total_value * self.config.min_position_ratio
+        if account_info.available_amount < min_investment:
+            self.logger.warning(f"⚠️ 매수 가능 금액 부족: {account_info.available_amount:,.0f}원 "
+                               f"(최소 필요: {min_investment:,.0f}원)")
+            return False
+        
+        # 포지션 수 확인
+        if len(positions) >= self.config.max_position_count:
+            self.logger.warning(f"⚠️ 최대 포지션 수 초과: {len(positions)}/{self.config.max_position_count}")
             return False
+        
+        # 중복 포지션 확인
+        if signal.stock_code in positions:
+            self.logger.warning(f"⚠️ 이미 보유 중인 종목: {signal.stock_name}")
+            return False
+        
+        # 🚨 핵심 추가: 오늘 매수한 종목 중복 매수 방지
+        if self.is_today_buy_stock(signal.stock_code):
+            self.logger.warning(f"🚫 오늘 이미 매수한 종목: {signal.stock_name} ({signal.stock_code})")
+            self._send_message(f"🚫 {signal.stock_name}: 오늘 이미 매수한 종목입니다")
+            return False
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"✅ 오늘 매수하지 않은 종목: {signal.stock_name} ({signal.stock_code})")
+        
+        return True
     
     def _validate_sell_order(self, signal: TradingSignal, positions: Dict[str, Position]) -> bool:
         """매도 주문 검증"""
-        try:
-            # 보유 포지션 확인
-            if signal.stock_code not in positions:
-                self.logger.warning(f"⚠️ 보유하지 않은 종목: {signal.stock_name}")
-                return False
-            
-            position = positions[signal.stock_code]
-            
-            # 보유 수량 확인
-            if position.quantity <= 0:
-                self.logger.warning(f"⚠️ 보유 수량 없음: {signal.stock_name}")
-                return False
-            
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"❌ 매도 주문 검증 오류: {e}")
+        # 보유 포지션 확인
+        position = positions.get(signal.stock_code)
+        if position is None:
+            self.logger.warning(f"⚠️ 보유하지 않은 종목: {signal.stock_name}")
             return False
+        
+        # 보유 수량 확인
+        if position.quantity <= 0:
+            self.logger.warning(f"⚠️ 보유 수량 없음: {signal.stock_name}")
+            return False
+        
+        return True
     
     def _process_buy_order_result(self, signal: TradingSignal, order_result: OrderResult, 
-                                 quantity: int) -> None:
+                                 quantity: int, ts: Optional[datetime] = None) -> None:
         """매수 주문 결과 처리"""
-        try:
-            self.order_stats['total_orders'] += 1
-            self.order_stats['buy_orders'] += 1
-            self.order_stats['last_order_time'] = now_kst()
+        success = bool(order_result and order_result.success)
+        with self._bookkeeping_lock:
+            order_stats = self.order_stats
+            order_stats.total_orders += 1
+            order_stats.buy_orders += 1
+            order_stats.last_order_time = ts or now_kst()
+            if success:
+                order_stats.successful_orders += 1
+            else:
+                order_stats.failed_orders += 1
+        
+        if success:
+            self.logger.info(f"✅ 매수 주문 성공: {signal.stock_name} {quantity}주 @ {signal.price:,.0f}원")
             
-            if order_result and order_result.success:
-                self.order_stats['successful_orders'] += 1
-                self.logger.info(f"✅ 매수 주문 성공: {signal.stock_name} {quantity}주 @ {signal.price:,.0f}원")
-                
-                # 상세 정보 로그
+            # 상세 정보 로그
+            if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(f"📋 주문 상세: ID={order_result.order_id}, 금액={quantity * signal.price:,.0f}원")
-                
-                # 계좌 정보 업데이트 콜백 호출
-                if self.account_update_callback:
-                    trade_amount = quantity * signal.price
-                    self.account_update_callback(trade_amount, True)  # True = 매수
-                
-            else:
-                self.order_stats['failed_orders'] += 1
-                error_msg = order_result.message if order_result else "주문 실패"
-                self.logger.error(f"❌ 매수 주문 실패: {signal.stock_name} - {error_msg}")
-                
-        except Exception as e:
-            self.logger.error(f"❌ 매수 주문 결과 처리 오류: {e}")
+            
+            # 계좌 정보 업데이트 콜백 호출 (외부 콜백 오류가 대기 주문 등록을 막지 않도록 보호)
+            trade_amount = quantity * signal.price
+            try:
+                self.account_update_callback(trade_amount, True)  # True = 매수
+            except Exception as e:
+                self.logger.error(f"❌ 매수 주문 결과 처리 오류: {e}")
+        
+        else:
+            error_msg = order_result.message if order_result else "주문 실패"
+            self.logger.error(f"❌ 매수 주문 실패: {signal.stock_name} - {error_msg}")
     
     def _process_sell_order_result(self, signal: TradingSignal, order_result: OrderResult, 
-                                  quantity: int, position: Position) -> None:
+                                  quantity: int, position: Position,
+                                  ts: Optional[datetime] = None) -> None:
         """매도 주문 결과 처리 (주문 접수 시점)"""
-        try:
-            self.order_stats['total_orders'] += 1
-            self.order_stats['sell_orders'] += 1
-            self.order_stats['last_order_time'] = now_kst()
+        success = bool(order_result and order_result.success)
+        with self._bookkeeping_lock:
+            order_stats = self.order_stats
+            order_stats.total_orders += 1
+            order_stats.sell_orders += 1
+            order_stats.last_order_time = ts or now_kst()
+            if success:
+                order_stats.successful_orders += 1
+            else:
+                order_stats.failed_orders += 1
+        
+        if success:
+            # 손익 계산 (예상)
+            price_diff = signal.price - position.avg_price
+            profit_loss = price_diff * quantity
+            profit_loss_rate = price_diff / position.avg_price * 100 if position.avg_price > 0 else 0.0
             
-            if order_result and order_result.success:
-                self.order_stats['successful_orders'] += 1
-                
-                # 손익 계산 (예상)
-                profit_loss = (signal.price - position.avg_price) * quantity
-                profit_loss_rate = (signal.price - position.avg_price) / position.avg_price * 100
-                
-                self.logger.info(f"✅ 매도 주문 성공: {signal.stock_name} {quantity}주 @ {signal.price:,.0f}원")
-                self.logger.info(f"💰 손익: {profit_loss:+,.0f}원 ({profit_loss_rate:+.2f}%)")
-                
-                # 상세 정보 로그
+            self.logger.info(f"✅ 매도 주문 성공: {signal.stock_name} {quantity}주 @ {signal.price:,.0f}원")
+            self.logger.info(f"💰 손익: {profit_loss:+,.0f}원 ({profit_loss_rate:+.2f}%)")
+            
+            # 상세 정보 로그
+            if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(f"📋 주문 상세: ID={order_result.order_id}, 사유={signal.reason}")
-                
-                # 🚨 핵심 수정: 주문 접수 시점에는 포지션 업데이트하지 않음
-                # 실제 체결 시에만 콜백 호출하도록 변경
-                # 계좌 정보와 포지션 업데이트는 체결 확인 시에만 수행
-                # 메타데이터는 add_pending_order에서 처리됨
-                
-            else:
-                self.order_stats['failed_orders'] += 1
-                error_msg = order_result.message if order_result else "주문 실패"
-                self.logger.error(f"❌ 매도 주문 실패: {signal.stock_name} - {error_msg}")
-                
-        except Exception as e:
-            self.logger.error(f"❌ 매도 주문 결과 처리 오류: {e}")
+            
+            # 🚨 핵심 수정: 주문 접수 시점에는 포지션 업데이트하지 않음
+            # 실제 체결 시에만 콜백 호출하도록 변경
+            # 계좌 정보와 포지션 업데이트는 체결 확인 시에만 수행
+            # 메타데이터는 add_pending_order에서 처리됨
+            
+        else:
+            error_msg = order_result.message if order_result else "주문 실패"
+            self.logger.error(f"❌ 매도 주문 실패: {signal.stock_name} - {error_msg}")
+    
+    @property
+    def success_rate(self) -> float:
+        """주문 성공률 (%)"""
+        return self.order_stats.success_rate
     
     def get_order_stats(self) -> Dict[str, Any]:
-        """주문 통계 반환"""
-        try:
-            stats = self.order_stats.copy()
-            stats['success_rate'] = (
-                (stats['successful_orders'] / stats['total_orders'] * 100) 
-                if stats['total_orders'] > 0 else 0.0
-            )
-            return stats
-        except Exception as e:
-            self.logger.error(f"❌ 주문 통계 조회 오류: {e}")
-            return {}
+        """주문 통계 반환 (필드 접근만 필요하면 order_stats를 직접 사용)"""
+        with self._bookkeeping_lock:
+            order_stats = self.order_stats
+            return {
+                'total_orders': order_stats.total_orders,
+                'successful_orders': order_stats.successful_orders,
+                'failed_orders': order_stats.failed_orders,
+                'buy_orders': order_stats.buy_orders,
+                'sell_orders': order_stats.sell_orders,
+                'partial_fills': order_stats.partial_fills,
+                'cancelled_orders': order_stats.cancelled_orders,
+                'last_order_time': order_stats.last_order_time,
+                'success_rate': order_stats.success_rate,
+            }
     
-    def _send_message(self, message: str) -> None:
-        """메시지 전송"""
-        try:
-            self.message_queue.put({
-                'type': 'order',
-                'message': message,
-                'timestamp': now_kst()
-            })
-        except Exception as e:
-            self.logger.error(f"❌ 메시지 전송 오류: {e}")
+    def _send_message(self, message: str, ts: Optional[datetime] = None, urgent: bool = False) -> None:
+        """
+        메시지 전송 (버퍼에 모았다가 한 번에 전송)
+        
+        건수가 _msg_buffer_max에 도달하거나, 첫 메시지가 _msg_max_delay 이상 대기했거나,
+        urgent(오류 등 즉시 알림)인 경우 바로 메시지 큐로 전송합니다.
+        """
+        with self._msg_lock:
+            now_mono = time.monotonic()
+            if not self._msg_buffer:
+                self._msg_buffer_since = now_mono
+            self._msg_buffer.append(message)
+            if (not urgent and len(self._msg_buffer) < self._msg_buffer_max and
+                    now_mono - self._msg_buffer_since < self._msg_max_delay):
+                return
+            messages, self._msg_buffer = self._msg_buffer, []
+        
+        self._put_messages(messages, ts)
+    
+    def flush_messages(self) -> None:
+        """버퍼에 쌓인 메시지를 메시지 큐로 전송 (매 루프 1회 호출)"""
+        with self._msg_lock:
+            if not self._msg_buffer:
+                return
+            messages, self._msg_buffer = self._msg_buffer, []
+        
+        self._put_messages(messages)
+    
+    def _put_messages(self, messages: List[str], ts: Optional[datetime] = None) -> None:
+        """모아둔 메시지를 하나의 큐 항목으로 전송"""
+        self.message_queue.put({
+            'type': 'order',
+            'message': "\n".join(messages),
+            'timestamp': ts or now_kst()
+        })
     
     # ========== 주문 추적 및 관리 기능 ==========
     
@@ -371,6 +520,7 @@ class OrderManager:
             return
         
         self.order_tracking_active = True
+        self._stop_event.clear()
         self.tracking_thread = threading.Thread(target=self._order_tracking_loop, daemon=True)
         self.tracking_thread.start()
         self.logger.info("✅ 주문 추적 시작")
@@ -381,8 +531,10 @@ class OrderManager:
             return
         
         self.order_tracking_active = False
+        self._stop_event.set()
         if self.tracking_thread and self.tracking_thread.is_alive():
             self.tracking_thread.join(timeout=5)
+        self.flush_messages()
         self.logger.info("✅ 주문 추적 중지")
     
     def _order_tracking_loop(self) -> None:
@@ -392,340 +544,480 @@ class OrderManager:
         while self.order_tracking_active:
             try:
                 self._check_pending_orders()
-                self._cleanup_completed_orders()
+                self.flush_messages()
                 
-                # 10초마다 체크
-                for _ in range(10):
-                    if not self.order_tracking_active:
-                        break
-                    threading.Event().wait(1)
+                # 가장 이른 주문의 다음 확인 시각까지 대기 (중지 요청 시 즉시 깨어남)
+                if self._stop_event.wait(self._get_poll_interval()):
+                    break
                 
             except Exception as e:
                 self.logger.error(f"❌ 주문 추적 루프 오류: {e}")
-                threading.Event().wait(30)  # 오류 발생 시 30초 대기
+                if self._stop_event.wait(30.0):  # 오류 발생 시 30초 대기
+                    break
         
         self.logger.info("🔄 주문 추적 루프 종료")
     
+    def _get_poll_interval(self) -> float:
+        """다음 체결 확인까지 대기 시간 (미완료 주문 중 가장 이른 다음 확인 시각 기준, 없으면 기본값)"""
+        with self._pending_lock:
+            next_check_at = min((order.next_check_at for order in self._active_orders.values()),
+                                default=None)
+        if next_check_at is None:
+            return _DEFAULT_POLL_INTERVAL
+        return max(next_check_at - time.monotonic(), _MIN_POLL_INTERVAL)
+    
+    @staticmethod
+    def _schedule_next_check(pending_order: PendingOrder, now_mono: float, reset: bool) -> None:
+        """다음 체결 확인 시각 예약 (상태 변동 시 첫 간격으로, 변동 없으면 타입별 간격까지 2배씩 백오프)"""
+        if reset:
+            interval = min(_INITIAL_CHECK_INTERVAL, pending_order.poll_interval_sec)
+        else:
+            interval = min(pending_order.check_interval_sec * 2, pending_order.poll_interval_sec)
+        pending_order.check_interval_sec = interval
+        pending_order.next_check_at = now_mono + interval
+    
     def _check_pending_orders(self) -> None:
-        """대기 중인 주문들 체결 확인 (개선된 버전)"""
-        if not self.pending_orders:
-            return
+        """대기 중인 주문들 체결 확인 및 완료 주문 정리 (한 번의 순회로 처리)"""
+        with self._pending_lock:
+            if not self.pending_orders:
+                # 이미 제거된 주문의 정리/만료 예약만 남은 상태
+                self._terminal_queue.clear()
+                self._deadline_heap.clear()
+                self._active_orders.clear()
+                return
         
         current_time = now_kst()
-        orders_to_process = list(self.pending_orders.values())
+        before_open = is_before_market_open(current_time)  # 틱 단위로 한 번만 판정
+        # 완료된 지 1분 지난 주문 정리 (완료 순서 큐의 앞쪽만 확인, 꺼내면서 바로 제거)
+        removed_count = 0
+        mono_now = time.monotonic()
+        cutoff = mono_now - 60
+        terminal_queue = self._terminal_queue
+        while terminal_queue and terminal_queue[0][0] < cutoff:
+            if self._remove_pending_order(terminal_queue.popleft()[1]):
+                removed_count += 1
+        if removed_count and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"🧹 완료된 주문 정리: {removed_count}건")
         
-        self.logger.debug(f"🔍 대기 중인 주문 {len(orders_to_process)}건 체결 확인 시작")
+        # 체결 확인/만료 처리는 체결 완료·취소 전 주문 목록만 순회 (정리 대기 중인 완료 주문 제외)
+        # 만료 후보는 만료 시각 힙에서 시각이 지난 것만 꺼냄 (전체 주문 만료 계산 생략)
+        due_ids: Set[str] = set()
+        with self._pending_lock:
+            orders_to_process = [order for order in self._active_orders.values()
+                                 if order.order_status not in _TERMINAL_STATUSES]
+            deadline_heap = self._deadline_heap
+            while deadline_heap and deadline_heap[0][0] < current_time:
+                due_ids.add(heapq.heappop(deadline_heap)[1])
+        
+        # 정리 대기 중인 완료 주문만 남은 경우 이번 틱은 확인할 것이 없음
+        if not orders_to_process:
+            return
         
+        orders_to_check: List[PendingOrder] = []
+        expired_orders: List[PendingOrder] = []
         for pending_order in orders_to_process:
             try:
-                # 주문 기본 정보 로깅
-                elapsed_minutes = (current_time - pending_order.order_time).total_seconds() / 60
-                self.logger.debug(f"📋 주문 확인: {pending_order.order_id} ({pending_order.stock_name}) "
-                                f"- 상태: {pending_order.order_status.value}, 경과: {elapsed_minutes:.1f}분")
-                
-                # 주문 만료 확인
-                if pending_order.is_expired:
-                    self.logger.info(f"⏰ 주문 만료 감지: {pending_order.order_id}")
-                    self._handle_expired_order(pending_order)
-                    continue
+                # 주문 만료 확인 (만료 주문은 모아서 일괄 처리)
+                if pending_order.order_id in due_ids:
+                    if pending_order.check_expired(current_time, before_open):
+                        self.logger.info(f"⏰ 주문 만료 감지: {pending_order.order_id}")
+                        expired_orders.append(pending_order)
+                        continue
                 
-                # 체결 상태 확인
-                self._check_order_status(pending_order)
+                # 다음 확인 시각이 안 된 주문은 이번 틱에서 조회하지 않음
+                if pending_order.next_check_at <= mono_now:
+                    orders_to_check.append(pending_order)
                 
             except Exception as e:
                 self.logger.error(f"❌ 주문 체크 오류 [{pending_order.order_id}]: {e}")
         
-        self.logger.debug(f"✅ 대기 중인 주문 체결 확인 완료")
-    
-    def _check_order_status(self, pending_order: PendingOrder) -> None:
-        """개별 주문 체결 상태 확인 (개선된 버전)"""
+        changed: Dict[OrderStatus, int] = {}
         try:
-            # 🔍 이미 체결 완료되거나 취소된 주문은 추가 처리 안함
-            if pending_order.order_status in [OrderStatus.FILLED, OrderStatus.CANCELLED]:
-                return
-            
-            # 🕘 장 시작 전에는 체결 확인하지 않음 (장전 주문은 09:00 이후 체결 가능)
-            # 단, 테스트 모드일 때는 시간 제한 없이 체결 확인 가능
-            from utils.korean_time import is_before_market_open, now_kst as kst_now
-            current_time = kst_now()
-            
-            if is_before_market_open(current_time) and not self.config.test_mode:
-                self.logger.debug(f"🕘 장 시작 전이므로 체결 확인 대기: {pending_order.order_id} "
+            if expired_orders:
+                self._handle_expired_orders(expired_orders, current_time, before_open)
+            if orders_to_check:
+                changed = self._check_order_statuses(orders_to_check, current_time, before_open)
+        finally:
+            # 만료 확인 후에도 남아 있는 주문은 만료 힙에 다시 예약 (힙에서 빠진 채로 방치되지 않도록)
+            if due_ids:
+                self._reschedule_due_orders(due_ids, current_time)
+        expired_count = len(expired_orders)
+        
+        # 주문별 로그 대신 틱 단위 요약 1건 (변동이 있을 때만 INFO)
+        filled_count = changed.get(OrderStatus.FILLED, 0)
+        partial_count = changed.get(OrderStatus.PARTIAL_FILLED, 0)
+        cancelled_count = changed.get(OrderStatus.CANCELLED, 0)
+        log = self.logger.info if (filled_count or partial_count or cancelled_count or expired_count) else self.logger.debug
+        log(f"🔄 주문 체결 확인: 확인 {len(orders_to_check)}건, 체결 {filled_count}건, 부분체결 {partial_count}건, "
+            f"취소 {cancelled_count}건, 만료 {expired_count}건, 정리 {removed_count}건")
+    
+    def _reschedule_due_orders(self, due_ids: Set[str], current_time: datetime) -> None:
+        """
+        만료 확인 대상이었던 주문 중 아직 체결 완료/취소되지 않은 주문을 만료 힙에 다시 예약
+        
+        장 시작 전이라 만료 처리를 미룬 주문, 취소 실패·부분 체결 후 취소 실패·처리 중 오류로 남은 주문은
+        _EXPIRY_RETRY_DELAY 뒤에 다시 만료 확인합니다.
+        """
+        retry_at = current_time + _EXPIRY_RETRY_DELAY
+        with self._pending_lock:
+            active_orders = self._active_orders
+            deadline_heap = self._deadline_heap
+            for order_id in due_ids:
+                pending_order = active_orders.get(order_id)
+                if pending_order is not None and pending_order.order_status not in _TERMINAL_STATUSES:
+                    heapq.heappush(deadline_heap, (max(pending_order.expires_at, retry_at), order_id))
+    
+    def _check_order_statuses(self, orders_to_check: List[PendingOrder], current_time: datetime,
+                              before_open: bool) -> Dict[OrderStatus, int]:
+        """
+        대기 주문 체결 상태 일괄 확인 (계좌 단위 조회 1회로 모든 주문 판정)
+        
+        Returns:
+            Dict[OrderStatus, int]: 이번 확인으로 상태가 바뀐 주문 수 (바뀐 상태별)
+        """
+        changed: Dict[OrderStatus, int] = {}
+        now_mono = time.monotonic()
+        
+        # 🕘 장 시작 전에는 체결 확인하지 않음 (장전 주문은 09:00 이후 체결 가능)
+        # 단, 테스트 모드일 때는 시간 제한 없이 체결 확인 가능
+        if before_open and not self.config.test_mode:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"🕘 장 시작 전이므로 체결 확인 대기: {len(orders_to_check)}건 "
                                 f"({current_time.strftime('%H:%M:%S')})")
-                return
-            
-            # 🔧 개선: KIS API로 주문 상태 조회 전 안전 장치
+            for pending_order in orders_to_check:
+                self._schedule_next_check(pending_order, now_mono, reset=False)
+            return changed
+        
+        # 🔧 개선: KIS API로 주문 상태 조회 전 안전 장치
+        try:
+            statuses = self.api_manager.get_order_statuses([order.order_id for order in orders_to_check])
+        except Exception as api_error:
+            self.logger.warning(f"⚠️ 주문 상태 API 호출 실패: {len(orders_to_check)}건 - {api_error}")
+            for pending_order in orders_to_check:
+                self._schedule_next_check(pending_order, now_mono, reset=False)
+            return changed
+        
+        for pending_order in orders_to_check:
+            previous_status = pending_order.order_status
+            previous_sig = pending_order.last_status_sig
             try:
-                order_status = self.api_manager.get_order_status(pending_order.order_id)
-            except Exception as api_error:
-                self.logger.warning(f"⚠️ 주문 상태 API 호출 실패: {pending_order.order_id} - {api_error}")
-                return
-            
-            if not order_status:
+                self._check_order_status(pending_order, statuses.get(pending_order.order_id), current_time)
+            except Exception as e:
+                self.logger.error(f"❌ 주문 체크 오류 [{pending_order.order_id}]: {e}")
+            sig_changed = pending_order.last_status_sig is not previous_sig
+            if sig_changed:
+                self._tracking_status_dirty = True  # 체결량 등이 갱신됨
+            self._schedule_next_check(pending_order, now_mono, reset=sig_changed)
+            if pending_order.order_status != previous_status:
+                changed[pending_order.order_status] = changed.get(pending_order.order_status, 0) + 1
+        
+        return changed
+    
+    def _check_order_status(self, pending_order: PendingOrder, order_status: Optional[Dict[str, Any]],
+                            check_time: Optional[datetime] = None) -> None:
+        """
+        개별 주문 체결 상태 반영 (조회된 주문 상태 기준)
+        
+        Args:
+            check_time: 확인 시각 (추적 틱 시각 공유, 없으면 현재 시각)
+        """
+        if check_time is None:
+            check_time = now_kst()
+        if not order_status:
+            if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(f"📊 주문 상태 조회 결과 없음: {pending_order.order_id}")
+            return
+        
+        # 🆕 주문 상태 불명인 경우 처리
+        if order_status.get('status_unknown', False):
+            # 접수 직후라 아직 조회 목록에 반영되지 않은 주문은 다음 확인까지 대기
+            if (not pending_order.confirmed and
+                    time.monotonic() - pending_order.order_time_monotonic < _UNCONFIRMED_GRACE_SEC):
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"⏳ 접수 확인 대기 중인 주문: {pending_order.order_id}")
                 return
+            self.logger.warning(f"⚠️ 주문 상태 불명 감지: {pending_order.order_id}")
+            # 상태 불명 주문은 취소된 것으로 간주
+            pending_order.order_status = OrderStatus.CANCELLED
+            pending_order.cancel_reason = "주문 상태 불명 (API에서 추적 불가)"
+            
+            # 대기 목록에서 제거
+            if self._remove_pending_order(pending_order.order_id):
+                self.logger.info(f"🗑️ 상태 불명 주문 제거: {pending_order.order_id}")
+            return
+        
+        pending_order.confirmed = True
+        
+        # 필드 한 번에 추출 (누락 필드가 있으면 기본값으로 보충)
+        try:
+            status_sig = _STATUS_FIELDS(order_status)
+        except KeyError:
+            status_sig = tuple(order_status.get(key, default)
+                               for key, default in zip(_STATUS_KEYS, _STATUS_DEFAULTS))
+        
+        # 🔍 직전 조회와 상태가 같으면 파싱/판정 생략 (확인 시각만 갱신)
+        if status_sig == pending_order.last_status_sig:
+            pending_order.last_check_time = check_time
+            return
+        
+        # 🔧 개선: 안전한 데이터 추출 (API 문서 기준 필드명)
+        try:
+            # API 문서 기준 필드명 사용 - 쉼표 제거 후 안전한 변환
+            raw_filled, raw_remaining, raw_order, cancelled, raw_cancel_confirm = status_sig
+            filled_qty = _parse_qty(str(raw_filled))          # 총체결수량
+            remaining_qty = _parse_qty(str(raw_remaining))    # 잔여수량
+            order_qty = _parse_qty(str(raw_order))            # 주문수량
             
-            # 🆕 주문 상태 불명인 경우 처리
-            if order_status.get('status_unknown', False):
-                self.logger.warning(f"⚠️ 주문 상태 불명 감지: {pending_order.order_id}")
-                # 상태 불명 주문은 취소된 것으로 간주
-                pending_order.order_status = OrderStatus.CANCELLED
-                pending_order.cancel_reason = "주문 상태 불명 (API에서 추적 불가)"
-                
-                # 대기 목록에서 제거
-                if pending_order.order_id in self.pending_orders:
-                    del self.pending_orders[pending_order.order_id]
-                    self.logger.info(f"🗑️ 상태 불명 주문 제거: {pending_order.order_id}")
-                return
+            # 🆕 추가 검증: 취소확인수량도 확인
+            cancel_confirm_qty = _parse_qty(str(raw_cancel_confirm))
             
-            # 🔧 개선: 안전한 데이터 추출 (API 문서 기준 필드명)
-            try:
-                # API 문서 기준 필드명 사용 - 쉼표 제거 후 안전한 변환
-                filled_qty_str = str(order_status.get('tot_ccld_qty', '0')).replace(',', '')
-                remaining_qty_str = str(order_status.get('rmn_qty', '0')).replace(',', '')
-                order_qty_str = str(order_status.get('ord_qty', '0')).replace(',', '')
-                
-                filled_qty = int(float(filled_qty_str))      # 총체결수량
-                remaining_qty = int(float(remaining_qty_str)) # 잔여수량
-                order_qty = int(float(order_qty_str))        # 주문수량
-                cancelled = order_status.get('cncl_yn', 'N') # 취소여부
-                
-                # 🆕 추가 검증: 취소확인수량도 확인
-                cancel_confirm_qty_str = str(order_status.get('cnc_cfrm_qty', '0')).replace(',', '')
-                cancel_confirm_qty = int(float(cancel_confirm_qty_str))
-                
+            if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(f"📊 상태 파싱: 체결={filled_qty}, 잔여={remaining_qty}, 주문={order_qty}, 취소확인={cancel_confirm_qty}")
-                
-            except (ValueError, TypeError) as e:
-                self.logger.error(f"❌ 주문 상태 데이터 파싱 오류: {pending_order.order_id} - {e}")
-                self.logger.debug(f"📋 원본 데이터: {order_status}")
-                # 🔧 파싱 실패 시 원본 값으로 재시도
-                try:
-                    filled_qty = int(order_status.get('tot_ccld_qty', 0))
-                    remaining_qty = int(order_status.get('rmn_qty', 0))
-                    order_qty = int(order_status.get('ord_qty', 0))
-                    cancelled = order_status.get('cncl_yn', 'N')
-                    cancel_confirm_qty = 0
-                except:
-                    return
             
-            # 🔧 개선: 데이터 유효성 검증
-            if order_qty <= 0:
-                self.logger.warning(f"⚠️ 유효하지 않은 주문수량: {pending_order.order_id} - {order_qty}")
+        except (ValueError, TypeError) as e:
+            self.logger.error(f"❌ 주문 상태 데이터 파싱 오류: {pending_order.order_id} - {e}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"📋 원본 데이터: {order_status}")
+            # 🔧 파싱 실패 시 원본 값으로 재시도
+            try:
+                filled_qty = int(order_status.get('tot_ccld_qty', 0))
+                remaining_qty = int(order_status.get('rmn_qty', 0))
+                order_qty = int(order_status.get('ord_qty', 0))
+                cancelled = order_status.get('cncl_yn', 'N')
+                cancel_confirm_qty = 0
+            except (ValueError, TypeError):
                 return
-            
-            # 🔧 개선: 체결량 검증 및 로깅
+        
+        # 🔧 개선: 데이터 유효성 검증
+        if order_qty <= 0:
+            self.logger.warning(f"⚠️ 유효하지 않은 주문수량: {pending_order.order_id} - {order_qty}")
+            return
+        
+        # 🔧 개선: 체결량 검증 및 로깅
+        if self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(f"🔍 주문 상태 확인: {pending_order.order_id} - "
                             f"체결: {filled_qty}/{order_qty}, 잔여: {remaining_qty}, 취소: {cancelled}")
+        
+        # 상태 업데이트
+        pending_order.filled_quantity = filled_qty
+        pending_order.remaining_quantity = remaining_qty
+        pending_order.last_check_time = check_time
+        pending_order.last_status_sig = status_sig
+        
+        # 주문 취소 확인
+        if cancelled == 'Y':
+            # 🔍 이미 취소 처리되지 않은 경우만 처리
+            if pending_order.order_status is not OrderStatus.CANCELLED:
+                pending_order.order_status = OrderStatus.CANCELLED
+                pending_order.cancel_reason = "주문 취소"
+                self.logger.info(f"❌ 주문 취소 확인: {pending_order.order_id}")
+                
+                # 🔧 수정: 취소된 주문은 즉시 대기 목록에서 제거
+                if self._remove_pending_order(pending_order.order_id):
+                    self.logger.info(f"🗑️ 취소된 주문 제거: {pending_order.order_id}")
+            return
+        
+        # 🔧 개선: 체결 상태 판단 로직 강화
+        if filled_qty == 0:
+            # 미체결 상태
+            if pending_order.order_status is not OrderStatus.PENDING:
+                pending_order.order_status = OrderStatus.PENDING
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"📊 미체결 상태 확인: {pending_order.order_id}")
+                
+        elif filled_qty > 0 and filled_qty < order_qty:
+            # 부분 체결 상태
+            self._handle_partial_fill(pending_order)
             
-            # 상태 업데이트
-            pending_order.filled_quantity = filled_qty
-            pending_order.remaining_quantity = remaining_qty
-            pending_order.last_check_time = now_kst()
-            
-            # 주문 취소 확인
-            if cancelled == 'Y':
-                # 🔍 이미 취소 처리되지 않은 경우만 처리
-                if pending_order.order_status != OrderStatus.CANCELLED:
-                    pending_order.order_status = OrderStatus.CANCELLED
-                    pending_order.cancel_reason = "주문 취소"
-                    self.logger.info(f"❌ 주문 취소 확인: {pending_order.order_id}")
-                    
-                    # 🔧 수정: 취소된 주문은 즉시 대기 목록에서 제거
-                    if pending_order.order_id in self.pending_orders:
-                        del self.pending_orders[pending_order.order_id]
-                        self.logger.info(f"🗑️ 취소된 주문 제거: {pending_order.order_id}")
-                return
-            
-            # 🔧 개선: 체결 상태 판단 로직 강화
+        elif filled_qty == order_qty:
+            # 🚨 핵심 추가: 체결량이 0인 경우 완전 체결로 처리하지 않음
             if filled_qty == 0:
-                # 미체결 상태
-                if pending_order.order_status != OrderStatus.PENDING:
+                self.logger.info(f"📊 체결량 0으로 완전 체결 처리 안함: {pending_order.order_id}")
+                # 미체결 상태로 유지
+                if pending_order.order_status is not OrderStatus.PENDING:
                     pending_order.order_status = OrderStatus.PENDING
-                    self.logger.debug(f"📊 미체결 상태 확인: {pending_order.order_id}")
-                    
-            elif filled_qty > 0 and filled_qty < order_qty:
-                # 부분 체결 상태
-                self._handle_partial_fill(pending_order)
-                
-            elif filled_qty == order_qty:
-                # 🚨 핵심 추가: 체결량이 0인 경우 완전 체결로 처리하지 않음
-                if filled_qty == 0:
-                    self.logger.info(f"📊 체결량 0으로 완전 체결 처리 안함: {pending_order.order_id}")
-                    # 미체결 상태로 유지
-                    if pending_order.order_status != OrderStatus.PENDING:
-                        pending_order.order_status = OrderStatus.PENDING
-                    return
-                
-                # 🔧 중요: 완전 체결 처리 전 추가 검증
-                if remaining_qty != 0:
-                    self.logger.warning(f"⚠️ 데이터 불일치: {pending_order.order_id} - "
-                                      f"체결량={filled_qty}, 주문량={order_qty}, 잔여량={remaining_qty}")
-                    # 🆕 잔여량이 0이 아니어도 체결량이 주문량과 같으면 완전 체결로 처리
-                    # (API 응답 불일치 상황 대응)
-                    self.logger.info(f"📊 데이터 불일치 상황에서 완전 체결 처리: {pending_order.order_id}")
-                
-                # 완전 체결 확인 (로그 메시지 수정)
-                self.logger.info(f"✅ 완전 체결 확인: {pending_order.order_id} - 체결: {filled_qty}/{order_qty}")
-                self._handle_filled_order(pending_order)
-                
-            else:
-                # 비정상적인 상태 (체결량 > 주문량)
-                self.logger.error(f"❌ 비정상적인 체결 상태: {pending_order.order_id} - "
-                                f"체결량={filled_qty} > 주문량={order_qty}")
-                
-                # 🆕 비정상적인 상태에서도 체결량만큼은 처리
-                if filled_qty > order_qty:
-                    self.logger.warning(f"📊 비정상 상황 대응: 주문량만큼만 체결 처리")
-                    pending_order.filled_quantity = order_qty  # 주문량으로 제한
-                    self._handle_filled_order(pending_order)
+                return
             
-        except Exception as e:
-            self.logger.error(f"❌ 주문 상태 확인 오류 [{pending_order.order_id}]: {e}")
+            # 🔧 중요: 완전 체결 처리 전 추가 검증
+            if remaining_qty != 0:
+                self.logger.warning(f"⚠️ 데이터 불일치: {pending_order.order_id} - "
+                                  f"체결량={filled_qty}, 주문량={order_qty}, 잔여량={remaining_qty}")
+                # 🆕 잔여량이 0이 아니어도 체결량이 주문량과 같으면 완전 체결로 처리
+                # (API 응답 불일치 상황 대응)
+                self.logger.info(f"📊 데이터 불일치 상황에서 완전 체결 처리: {pending_order.order_id}")
+            
+            # 완전 체결 확인 (로그 메시지 수정)
+            self.logger.info(f"✅ 완전 체결 확인: {pending_order.order_id} - 체결: {filled_qty}/{order_qty}")
+            self._handle_filled_order(pending_order)
+            
+        else:
+            # 비정상적인 상태 (체결량 > 주문량)
+            self.logger.error(f"❌ 비정상적인 체결 상태: {pending_order.order_id} - "
+                            f"체결량={filled_qty} > 주문량={order_qty}")
+            
+            # 🆕 비정상적인 상태에서도 체결량만큼은 처리
+            if filled_qty > order_qty:
+                self.logger.warning(f"📊 비정상 상황 대응: 주문량만큼만 체결 처리")
+                pending_order.filled_quantity = order_qty  # 주문량으로 제한
+                self._handle_filled_order(pending_order)
     
     def _handle_filled_order(self, pending_order: PendingOrder) -> None:
         """완전 체결된 주문 처리 (개선된 버전)"""
-        try:
-            # 🔍 중복 처리 방지: 이미 체결 완료 상태인 경우 처리 안함
-            if pending_order.order_status == OrderStatus.FILLED:
+        # 🔍 중복 처리 방지: 이미 체결 완료 상태인 경우 처리 안함
+        if pending_order.order_status is OrderStatus.FILLED:
+            if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(f"🔍 이미 체결 완료 처리된 주문: {pending_order.order_id}")
-                return
-            
-            # 🚨 핵심 추가: 체결량이 0인 경우 체결 처리하지 않음
-            if pending_order.filled_quantity == 0:
-                self.logger.warning(f"🚨 체결량 0으로 체결 처리 거부: {pending_order.order_id}")
-                return
-            
-            # 🔧 개선: 체결량 검증
-            if pending_order.filled_quantity != pending_order.quantity:
-                self.logger.warning(f"⚠️ 체결량 불일치: {pending_order.order_id} - "
-                                  f"체결량={pending_order.filled_quantity}, 주문량={pending_order.quantity}")
-                # 불일치 시 실제 체결량으로 조정
-                actual_filled_qty = pending_order.filled_quantity
-            else:
-                actual_filled_qty = pending_order.quantity
-            
-            # 🔧 개선: 체결량이 0이면 처리하지 않음
-            if actual_filled_qty <= 0:
-                self.logger.warning(f"⚠️ 체결량이 0이거나 음수: {pending_order.order_id} - {actual_filled_qty}")
-                return
-            
-            pending_order.order_status = OrderStatus.FILLED
-            
-            # 통계 업데이트
-            self.order_stats['successful_orders'] += 1
-            
-            # 🔧 개선: 이전 처리된 체결량 계산 (중복 처리 방지)
-            previous_filled_qty = getattr(pending_order, 'previous_filled_quantity', 0)
-            new_filled_qty = actual_filled_qty - previous_filled_qty
-            
-            # 🔧 개선: 새로운 체결량이 없으면 콜백 호출하지 않음
-            if new_filled_qty <= 0:
-                self.logger.warning(f"⚠️ 새로운 체결량 없음: {pending_order.order_id} - "
-                                  f"전체:{actual_filled_qty}, 이전:{previous_filled_qty}")
-                # 상태는 체결 완료로 변경하되 콜백은 호출하지 않음
-                if pending_order.order_id in self.pending_orders:
-                    del self.pending_orders[pending_order.order_id]
-                    self.logger.info(f"🗑️ 중복 처리 방지로 주문 제거: {pending_order.order_id}")
-                return
-            
-            # 알림 전송
-            message = (f"✅ {pending_order.stock_name} "
-                      f"{'매수' if pending_order.signal_type == SignalType.BUY else '매도'} "
-                      f"체결완료: {actual_filled_qty}주 @ {pending_order.price:,}원")
-            
-            self._send_message(message)
-            
-            # 🔧 개선: 새로운 체결량에 대해서만 콜백 호출
-            if new_filled_qty > 0:
-                # 계좌 정보 업데이트 콜백 호출 (새로운 체결량만)
-                if self.account_update_callback:
-                    trade_amount = new_filled_qty * pending_order.price
-                    is_buy = pending_order.signal_type == SignalType.BUY
-                    self.account_update_callback(trade_amount, is_buy)
-                
-                # 보유 종목 업데이트 콜백 호출 (새로운 체결량만)
-                if self.held_stocks_update_callback:
-                    is_buy = pending_order.signal_type == SignalType.BUY
-                    
-                    # 🔧 주문 데이터에서 메타데이터 추출 (부분매도 정보 등)
-                    signal_metadata = None
-                    if hasattr(pending_order, 'order_data') and pending_order.order_data:
-                        signal_metadata = pending_order.order_data.get('signal_metadata', None)
-                    
-                    self.held_stocks_update_callback(
-                        pending_order.stock_code,
-                        pending_order.stock_name,
-                        new_filled_qty,  # ✅ 새로운 체결량만 전달
-                        pending_order.price,
-                        is_buy,
-                        signal_metadata  # 🔧 실제 메타데이터 전달
-                    )
-                
-                self.logger.info(f"📊 체결 콜백 호출: {pending_order.stock_name} {new_filled_qty}주 "
-                               f"({'매수' if pending_order.signal_type == SignalType.BUY else '매도'})")
-            
-            # 🔧 수정: 완전 체결된 주문은 즉시 대기 목록에서 제거
-            if pending_order.order_id in self.pending_orders:
-                del self.pending_orders[pending_order.order_id]
-                self.logger.info(f"🗑️ 완전 체결 주문 제거: {pending_order.order_id}")
-            
-            self.logger.info(f"✅ 주문 체결 완료: {pending_order.order_id} (실제 체결량: {actual_filled_qty}주)")
-            
-        except Exception as e:
-            self.logger.error(f"❌ 체결 주문 처리 오류: {e}")
+            return
+        
+        # 🚨 핵심 추가: 체결량이 0인 경우 체결 처리하지 않음
+        if pending_order.filled_quantity == 0:
+            self.logger.warning(f"🚨 체결량 0으로 체결 처리 거부: {pending_order.order_id}")
+            return
+        
+        # 🔧 개선: 체결량 검증
+        if pending_order.filled_quantity != pending_order.quantity:
+            self.logger.warning(f"⚠️ 체결량 불일치: {pending_order.order_id} - "
+                              f"체결량={pending_order.filled_quantity}, 주문량={pending_order.quantity}")
+            # 불일치 시 실제 체결량으로 조정
+            actual_filled_qty = pending_order.filled_quantity
+        else:
+            actual_filled_qty = pending_order.quantity
+        
+        # 🔧 개선: 체결량이 0이면 처리하지 않음
+        if actual_filled_qty <= 0:
+            self.logger.warning(f"⚠️ 체결량이 0이거나 음수: {pending_order.order_id} - {actual_filled_qty}")
+            return
+        
+        pending_order.order_status = OrderStatus.FILLED
+        
+        # 통계 업데이트
+        with self._bookkeeping_lock:
+            self.order_stats.successful_orders += 1
+        
+        # 🔧 개선: 이전 처리된 체결량 계산 (중복 처리 방지)
+        previous_filled_qty = pending_order.previous_filled_quantity
+        new_filled_qty = actual_filled_qty - previous_filled_qty
+        
+        # 🔧 개선: 새로운 체결량이 없으면 콜백 호출하지 않음
+        if new_filled_qty <= 0:
+            self.logger.warning(f"⚠️ 새로운 체결량 없음: {pending_order.order_id} - "
+                              f"전체:{actual_filled_qty}, 이전:{previous_filled_qty}")
+            # 상태는 체결 완료로 변경하되 콜백은 호출하지 않음
+            if self._remove_pending_order(pending_order.order_id):
+                self.logger.info(f"🗑️ 중복 처리 방지로 주문 제거: {pending_order.order_id}")
+            return
+        
+        is_buy = pending_order.is_buy
+        side_label = _SIDE_LABELS[is_buy]
+        
+        # 알림 전송
+        message = (f"✅ {pending_order.stock_name} {side_label} "
+                  f"체결완료: {actual_filled_qty}주 @ {pending_order.price:,}원")
+        
+        self._send_message(message)
+        
+        # 🔧 개선: 새로운 체결량에 대해서만 콜백 호출
+        if new_filled_qty > 0:
+            # 🔧 주문 데이터에서 메타데이터 추출 (부분매도 정보 등)
+            signal_metadata = None
+            if pending_order.order_data:
+                signal_metadata = pending_order.order_data.get('signal_metadata', None)
+            
+            # 계좌/보유 종목 업데이트 (새로운 체결량만)
+            self._record_fill(pending_order, new_filled_qty, signal_metadata)
+            
+            self.logger.info(f"📊 체결 콜백 호출: {pending_order.stock_name} {new_filled_qty}주 "
+                           f"({side_label})")
+        
+        # 🔧 수정: 완전 체결된 주문은 콜백 반영 후 정리 대기열을 거치지 않고 즉시 대기 목록에서 제거
+        # (보유 종목/계좌 반영 전에 대기 주문이 사라지면 매매 스레드가 중복 매수·초과 매도할 수 있음)
+        if self._remove_pending_order(pending_order.order_id):
+            self.logger.info(f"🗑️ 완전 체결 주문 제거: {pending_order.order_id}")
+        
+        self.logger.info(f"✅ 주문 체결 완료: {pending_order.order_id} (실제 체결량: {actual_filled_qty}주)")
     
     def _handle_partial_fill(self, pending_order: PendingOrder) -> None:
         """부분 체결 주문 처리"""
-        try:
-            # 기존 부분 체결량 저장 (새로운 체결량 계산용)
-            previous_filled_qty = getattr(pending_order, 'previous_filled_quantity', 0)
-            new_filled_qty = pending_order.filled_quantity - previous_filled_qty
-            
-            if new_filled_qty > 0:  # ✅ 새로운 체결량이 있을 때만 처리
-                if pending_order.order_status != OrderStatus.PARTIAL_FILLED:
-                    pending_order.order_status = OrderStatus.PARTIAL_FILLED
-                    
-                    # 통계 업데이트
-                    self.order_stats['partial_fills'] += 1
-                    
-                    self.logger.info(f"🔄 부분 체결: {pending_order.order_id} "
-                                   f"({pending_order.filled_quantity}/{pending_order.quantity})")
+        # 기존 부분 체결량 저장 (새로운 체결량 계산용)
+        previous_filled_qty = pending_order.previous_filled_quantity
+        new_filled_qty = pending_order.filled_quantity - previous_filled_qty
+        
+        if new_filled_qty > 0:  # ✅ 새로운 체결량이 있을 때만 처리
+            if pending_order.order_status is not OrderStatus.PARTIAL_FILLED:
+                pending_order.order_status = OrderStatus.PARTIAL_FILLED
                 
-                # ✅ 새로운 체결량에 대해서만 계좌 정보 업데이트
-                if self.account_update_callback:
-                    new_filled_amount = new_filled_qty * pending_order.price
-                    is_buy = pending_order.signal_type == SignalType.BUY
-                    self.account_update_callback(new_filled_amount, is_buy)
+                # 통계 업데이트
+                with self._bookkeeping_lock:
+                    self.order_stats.partial_fills += 1
                 
-                # ✅ 새로운 체결량에 대해서만 보유 종목 업데이트
-                if self.held_stocks_update_callback:
-                    is_buy = pending_order.signal_type == SignalType.BUY
-                    self.held_stocks_update_callback(
-                        pending_order.stock_code,
-                        pending_order.stock_name,
-                        new_filled_qty,  # ✅ 새로운 체결량만 전달
-                        pending_order.price,
-                        is_buy,
-                        None  # 메타데이터 없음 (부분 체결)
-                    )
-            
-            # 다음 체크를 위해 현재 체결량 저장
-            pending_order.previous_filled_quantity = pending_order.filled_quantity
+                self.logger.info(f"🔄 부분 체결: {pending_order.order_id} "
+                               f"({pending_order.filled_quantity}/{pending_order.quantity})")
             
+            # ✅ 새로운 체결량에 대해서만 계좌/보유 종목 업데이트 (메타데이터 없음)
+            self._record_fill(pending_order, new_filled_qty, None)
+        
+        # 다음 체크를 위해 현재 체결량 저장
+        pending_order.previous_filled_quantity = pending_order.filled_quantity
+    
+    def _record_fill(self, pending_order: PendingOrder, quantity: int,
+                     signal_metadata: Optional[Dict[str, Any]]) -> None:
+        """
+        새 체결량을 계좌/보유 종목 콜백으로 즉시 반영
+        
+        Args:
+            pending_order: 체결된 주문
+            quantity: 새로 체결된 수량
+            signal_metadata: 신호 메타데이터 (부분매도 정보 등, 부분 체결은 None)
+        """
+        is_buy = pending_order.is_buy
+        try:
+            self.account_update_callback(quantity * pending_order.price, is_buy)
+        except Exception as e:
+            self.logger.error(f"❌ 계좌 정보 업데이트 콜백 오류 ({_SIDE_LABELS[is_buy]}): {e}")
+        
+        held_callback = self.held_stocks_update_callback
+        if held_callback is None:
+            return
+        try:
+            held_callback(pending_order.stock_code, pending_order.stock_name,
+                          quantity, pending_order.price, is_buy, signal_metadata)
         except Exception as e:
-            self.logger.error(f"❌ 부분 체결 처리 오류: {e}")
+            self.logger.error(f"❌ 보유 종목 업데이트 콜백 오류 [{pending_order.stock_code}]: {e}")
     
-    def _handle_expired_order(self, pending_order: PendingOrder) -> None:
-        """만료된 주문 처리 (취소)"""
+    def _handle_expired_orders(self, expired_orders: List[PendingOrder], current_time: datetime,
+                               before_open: bool) -> None:
+        """만료된 주문 일괄 처리 (최종 체결 확인은 계좌 단위 조회 1회로 수행)"""
+        statuses: Dict[str, Optional[Dict[str, Any]]] = {}
+        if not before_open:
+            try:
+                statuses = self.api_manager.get_order_statuses([order.order_id for order in expired_orders])
+            except Exception as api_error:
+                self.logger.warning(f"⚠️ 만료 주문 상태 일괄 조회 실패: {len(expired_orders)}건 - {api_error}")
+        
+        for pending_order in expired_orders:
+            self._handle_expired_order(pending_order, current_time, before_open,
+                                       statuses.get(pending_order.order_id))
+        self._tracking_status_dirty = True
+    
+    def _handle_expired_order(self, pending_order: PendingOrder, current_time: Optional[datetime] = None,
+                              before_open: Optional[bool] = None,
+                              order_status: Optional[Dict[str, Any]] = None) -> None:
+        """
+        만료된 주문 처리 (취소)
+        
+        Args:
+            order_status: 일괄 조회한 주문 상태 (없으면 단건 조회)
+        """
         try:
-            from utils.korean_time import is_before_market_open, get_market_open_today, now_kst as kst_now
-            
-            current_time = kst_now()
+            if current_time is None:
+                current_time = now_kst()
+            if before_open is None:
+                before_open = is_before_market_open(current_time)
             
             # 🔥 장 시작 전에는 취소 시도를 하지 않음
-            if is_before_market_open(current_time):
-                self.logger.debug(f"🔍 장 시작 전이므로 주문 취소를 연기: {pending_order.order_id}")
+            if before_open:
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"🔍 장 시작 전이므로 주문 취소를 연기: {pending_order.order_id}")
                 return
             
             # 장 시작 전 주문인지 확인하여 적절한 만료 시간 표시
@@ -735,7 +1027,7 @@ class OrderManager:
                 self.logger.warning(f"⏰ 주문 만료: {pending_order.order_id} "
                                   f"(장 시작 후 {actual_elapsed:.1f}분 경과)")
             else:
-                actual_elapsed = (current_time - pending_order.order_time).total_seconds() / 60
+                actual_elapsed = (time.monotonic() - pending_order.order_time_monotonic) / 60
                 self.logger.warning(f"⏰ 주문 만료: {pending_order.order_id} "
                                   f"({actual_elapsed:.1f}분 경과)")
             
@@ -743,80 +1035,52 @@ class OrderManager:
             # (09:00에 체결되었을 수도 있기 때문)
             self.logger.info(f"🔍 만료 주문 최종 체결 확인: {pending_order.order_id}")
             
-            # 🆕 최대 3번까지 재시도하여 체결 상태 확인
-            for retry_count in range(3):
-                try:
-                    order_status = self.api_manager.get_order_status(pending_order.order_id)
-                    if order_status:
-                        filled_qty = int(order_status.get('tot_ccld_qty', 0))
-                        order_qty = int(order_status.get('ord_qty', 0))
-                        cancelled = order_status.get('cncl_yn', 'N')
-                        
-                        self.logger.debug(f"🔍 만료 주문 상태 확인 시도 {retry_count+1}/3: {pending_order.order_id} - "
-                                        f"체결: {filled_qty}/{order_qty}, 취소: {cancelled}")
-                        
-                        # 이미 완전 체결되었다면 취소하지 않음
-                        if filled_qty > 0 and filled_qty == order_qty:
-                            self.logger.info(f"✅ 주문이 이미 체결됨: {pending_order.order_id} "
-                                           f"({filled_qty}/{order_qty}주) - 만료 취소 중단")
-                            # 체결 처리 로직으로 위임
-                            pending_order.filled_quantity = filled_qty
-                            pending_order.remaining_quantity = 0
-                            self._handle_filled_order(pending_order)
-                            return
-                        
-                        # 부분 체결된 경우도 확인
-                        elif filled_qty > 0 and filled_qty < order_qty:
-                            self.logger.info(f"🔄 주문이 부분 체결됨: {pending_order.order_id} "
-                                           f"({filled_qty}/{order_qty}주) - 잔여분만 취소")
-                            # 부분 체결 처리
-                            pending_order.filled_quantity = filled_qty
-                            pending_order.remaining_quantity = order_qty - filled_qty
-                            self._handle_partial_fill(pending_order)
-                            # 잔여분에 대해서는 취소 진행
-                            break
-                        
-                        # 이미 취소되었다면 상태만 업데이트
-                        elif cancelled == 'Y':
-                            pending_order.order_status = OrderStatus.CANCELLED
-                            pending_order.cancel_reason = "이미 취소됨"
-                            self.logger.info(f"ℹ️ 주문이 이미 취소됨: {pending_order.order_id}")
-                            # 🔧 취소된 주문은 즉시 대기 목록에서 제거
-                            if pending_order.order_id in self.pending_orders:
-                                del self.pending_orders[pending_order.order_id]
-                                self.logger.info(f"🗑️ 이미 취소된 주문 제거: {pending_order.order_id}")
-                            return
-                        
-                        # 체결량이 0이면 다음 시도
-                        elif filled_qty == 0:
-                            if retry_count < 2:  # 마지막 시도가 아니면
-                                self.logger.debug(f"⏳ 체결량 0 확인, 재시도 대기: {pending_order.order_id}")
-                                import time
-                                time.sleep(1)  # 1초 대기 후 재시도
-                                continue
-                            else:
-                                self.logger.info(f"📊 최종 확인 완료 - 미체결: {pending_order.order_id}")
-                                break
-                        else:
-                            break
-                    else:
-                        if retry_count < 2:
-                            self.logger.warning(f"⚠️ 주문 상태 조회 실패, 재시도: {pending_order.order_id}")
-                            import time
-                            time.sleep(1)
-                            continue
-                        else:
-                            self.logger.error(f"❌ 주문 상태 조회 최종 실패: {pending_order.order_id}")
-                            break
-                            
-                except Exception as e:
-                    self.logger.error(f"❌ 만료 주문 체결 확인 오류 (시도 {retry_count+1}/3): {e}")
-                    if retry_count < 2:
-                        import time
-                        time.sleep(1)
-                        continue
-                    else:
-                        break
+            # 🆕 체결 상태 확인 (일괄 조회 결과가 없을 때만 단건 조회, 실패 시 지수 백오프로 재시도)
+            if not order_status:
+                order_status = self._safe_get_order_status(pending_order.order_id)
+            if order_status:
+                filled_qty = _parse_qty(str(order_status.get('tot_ccld_qty', '0')))
+                order_qty = _parse_qty(str(order_status.get('ord_qty', '0')))
+                cancelled = order_status.get('cncl_yn', 'N')
+                
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"🔍 만료 주문 상태 확인: {pending_order.order_id} - "
+                                    f"체결: {filled_qty}/{order_qty}, 취소: {cancelled}")
+                
+                fill_state = _classify_fill(filled_qty, order_qty, cancelled)
+                
+                # 이미 완전 체결되었다면 취소하지 않음
+                if fill_state == _FILL_FULL:
+                    self.logger.info(f"✅ 주문이 이미 체결됨: {pending_order.order_id} "
+                                   f"({filled_qty}/{order_qty}주) - 만료 취소 중단")
+                    # 체결 처리 로직으로 위임
+                    pending_order.filled_quantity = filled_qty
+                    pending_order.remaining_quantity = 0
+                    self._handle_filled_order(pending_order)
+                    return
+                
+                # 부분 체결된 경우 잔여분만 취소
+                elif fill_state == _FILL_PARTIAL:
+                    self.logger.info(f"🔄 주문이 부분 체결됨: {pending_order.order_id} "
+                                   f"({filled_qty}/{order_qty}주) - 잔여분만 취소")
+                    pending_order.filled_quantity = filled_qty
+                    pending_order.remaining_quantity = order_qty - filled_qty
+                    self._handle_partial_fill(pending_order)
+                
+                # 이미 취소되었다면 상태만 업데이트
+                elif fill_state == _FILL_CANCELLED:
+                    pending_order.order_status = OrderStatus.CANCELLED
+                    pending_order.cancel_reason = "이미 취소됨"
+                    self.logger.info(f"ℹ️ 주문이 이미 취소됨: {pending_order.order_id}")
+                    # 🔧 취소된 주문은 즉시 대기 목록에서 제거
+                    if self._remove_pending_order(pending_order.order_id):
+                        self.logger.info(f"🗑️ 이미 취소된 주문 제거: {pending_order.order_id}")
+                    return
+                
+                elif fill_state == _FILL_NONE:
+                    self.logger.info(f"📊 최종 확인 완료 - 미체결: {pending_order.order_id}")
+            else:
+                self.logger.error(f"❌ 주문 상태 조회 최종 실패: {pending_order.order_id}")
             
             # 주문 취소 시도
             cancel_result = self._cancel_order(pending_order)
@@ -824,13 +1088,14 @@ class OrderManager:
             if cancel_result:
                 pending_order.order_status = OrderStatus.CANCELLED
                 pending_order.cancel_reason = "주문 만료"
+                self._mark_terminal(pending_order)
                 
                 # 통계 업데이트
-                self.order_stats['cancelled_orders'] += 1
+                with self._bookkeeping_lock:
+                    self.order_stats.cancelled_orders += 1
                 
                 # 알림 전송
-                message = (f"❌ {pending_order.stock_name} "
-                          f"{'매수' if pending_order.signal_type == SignalType.BUY else '매도'} "
+                message = (f"❌ {pending_order.stock_name} {_SIDE_LABELS[pending_order.is_buy]} "
                           f"주문 취소: {pending_order.timeout_minutes}분 미체결")
                 
                 self._send_message(message)
@@ -842,6 +1107,28 @@ class OrderManager:
         except Exception as e:
             self.logger.error(f"❌ 만료 주문 처리 오류: {e}")
     
+    def _safe_get_order_status(self, order_id: str, attempts: int = 3,
+                               base_delay: float = 0.25) -> Optional[Dict[str, Any]]:
+        """
+        단건 주문 상태 조회 (조회 실패/오류 시에만 0.25초, 0.5초... 간격으로 재시도)
+        
+        Returns:
+            Optional[Dict[str, Any]]: 주문 상태 (모든 시도 실패 시 None)
+        """
+        for attempt in range(attempts):
+            try:
+                order_status = self.api_manager.get_order_status(order_id)
+                if order_status:
+                    return order_status
+                self.logger.warning(f"⚠️ 주문 상태 조회 실패 (시도 {attempt+1}/{attempts}): {order_id}")
+            except Exception as e:
+                self.logger.error(f"❌ 주문 상태 조회 오류 (시도 {attempt+1}/{attempts}): {order_id} - {e}")
+            
+            if attempt < attempts - 1:
+                time.sleep(base_delay * (2 ** attempt))
+        
+        return None
+    
     def _cancel_order(self, pending_order: PendingOrder) -> bool:
         """주문 취소 실행"""
         try:
@@ -863,43 +1150,26 @@ class OrderManager:
             self.logger.error(f"❌ 주문 취소 오류: {e}")
             return False
     
-    def _cleanup_completed_orders(self) -> None:
-        """완료된 주문들 정리"""
-        try:
-            completed_orders = []
-            
-            for order_id, pending_order in self.pending_orders.items():
-                if pending_order.order_status in [OrderStatus.FILLED, OrderStatus.CANCELLED]:
-                    # 완료된 주문은 1분 후 정리
-                    if (now_kst() - pending_order.last_check_time).total_seconds() > 60:
-                        completed_orders.append(order_id)
-            
-            # 완료된 주문들 제거
-            for order_id in completed_orders:
-                del self.pending_orders[order_id]
-                
-            if completed_orders:
-                self.logger.debug(f"🧹 완료된 주문 정리: {len(completed_orders)}건")
-                
-        except Exception as e:
-            self.logger.error(f"❌ 주문 정리 오류: {e}")
-    
-    def add_pending_order(self, order_result: OrderResult, signal: TradingSignal) -> None:
+    def add_pending_order(self, order_result: OrderResult, signal: TradingSignal,
+                          ts: Optional[datetime] = None) -> None:
         """대기 중인 주문 추가"""
+        if ts is None:
+            ts = now_kst()
         try:
             if not order_result or not order_result.order_id:
                 self.logger.warning("⚠️ 유효하지 않은 주문 결과")
                 return
             
             # 주문 데이터에 테스트 모드 정보 추가
-            order_data = getattr(order_result, 'order_data', {})
+            order_data = order_result.order_data
             order_data['test_mode'] = self.config.test_mode
             
             # 🔧 부분매도 메타데이터 추가 (signal에서 추출)
             signal_metadata = getattr(signal, 'metadata', {})
             if signal_metadata:
                 order_data['signal_metadata'] = signal_metadata
-                self.logger.debug(f"📊 주문에 메타데이터 저장: {signal_metadata}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"📊 주문에 메타데이터 저장: {signal_metadata}")
             
             pending_order = PendingOrder(
                 order_id=order_result.order_id,
@@ -912,60 +1182,100 @@ class OrderManager:
                 price=signal.price,
                 filled_quantity=0,
                 remaining_quantity=signal.quantity,
-                order_time=now_kst(),
-                last_check_time=now_kst(),
+                order_time=ts,
+                last_check_time=ts,
                 original_signal=signal,
-                krx_fwdg_ord_orgno=getattr(order_result, 'krx_fwdg_ord_orgno', ''),
-                order_data=order_data
+                krx_fwdg_ord_orgno=order_result.krx_fwdg_ord_orgno,
+                order_data=order_data,
+                poll_interval_sec=self.config.order_poll_intervals.get(signal.order_type, _DEFAULT_POLL_INTERVAL)
             )
-            
-            self.pending_orders[order_result.order_id] = pending_order
+            self._schedule_next_check(pending_order, time.monotonic(), reset=True)
+            
+            with self._pending_lock:
+                self.pending_orders[order_result.order_id] = pending_order
+                self._active_orders[order_result.order_id] = pending_order
+                self._tracking_status_dirty = True
+                self._pending_snapshot = None
+                heapq.heappush(self._deadline_heap, (pending_order.expires_at, order_result.order_id))
+                if signal.signal_type is _SELL:
+                    self._pending_sell_ids_by_code.setdefault(signal.stock_code, set()).add(order_result.order_id)
             self.logger.info(f"📋 대기 주문 추가: {order_result.order_id}")
             
         except Exception as e:
             self.logger.error(f"❌ 대기 주문 추가 오류: {e}")
     
-    def get_pending_orders(self) -> Dict[str, PendingOrder]:
-        """대기 중인 주문 목록 반환"""
-        return self.pending_orders.copy()
+    def get_pending_orders(self) -> Mapping[str, PendingOrder]:
+        """대기 중인 주문 목록 반환 (읽기 전용, 목록이 바뀌지 않았으면 이전 스냅샷 재사용)"""
+        with self._pending_lock:
+            if self._pending_snapshot is None:
+                self._pending_snapshot = MappingProxyType(self.pending_orders.copy())
+            return self._pending_snapshot
     
     def get_order_tracking_status(self) -> Dict[str, Any]:
-        """주문 추적 상태 반환"""
+        """주문 추적 상태 반환 (주문 정보는 변경 시에만 재구성, 경과 시간은 조회 시점 기준)"""
+        with self._pending_lock:
+            if self._tracking_status_dirty:
+                self._tracking_status_cache = [
+                    ({
+                        'order_id': order.order_id,
+                        'stock_name': order.stock_name,
+                        'signal_type': order.signal_type.value,
+                        'status': order.order_status.value,
+                        'quantity': order.quantity,
+                        'filled_quantity': order.filled_quantity,
+                        'remaining_quantity': order.remaining_quantity,
+                        'order_time': order.order_time.strftime('%H:%M:%S'),
+                    }, order.order_time_monotonic)
+                    for order in self.pending_orders.values()
+                ]
+                self._tracking_status_dirty = False
+            cached = self._tracking_status_cache
+        
+        mono_now = time.monotonic()
         return {
             'active': self.order_tracking_active,
-            'pending_count': len(self.pending_orders),
+            'pending_count': len(cached),
             'pending_orders': [
-                {
-                    'order_id': order.order_id,
-                    'stock_name': order.stock_name,
-                    'signal_type': order.signal_type.value,
-                    'status': order.order_status.value,
-                    'quantity': order.quantity,
-                    'filled_quantity': order.filled_quantity,
-                    'remaining_quantity': order.remaining_quantity,
-                    'order_time': order.order_time.strftime('%H:%M:%S'),
-                    'elapsed_minutes': (now_kst() - order.order_time).total_seconds() / 60
-                }
-                for order in self.pending_orders.values()
+                dict(entry, elapsed_minutes=(mono_now - order_time_monotonic) / 60)
+                for entry, order_time_monotonic in cached
             ]
         }
     
+    def _mark_terminal(self, pending_order: PendingOrder) -> None:
+        """취소된 주문을 체결 확인 대상에서 빼고 정리 대기열에 등록 (1분 뒤 대기 목록에서 제거)"""
+        with self._pending_lock:
+            self._active_orders.pop(pending_order.order_id, None)
+        self._terminal_queue.append((time.monotonic(), pending_order.order_id))
+    
+    def _remove_pending_order(self, order_id: str) -> Optional[PendingOrder]:
+        """대기 목록에서 주문 제거 (종목별 매도 주문 인덱스 동기화)"""
+        with self._pending_lock:
+            pending_order = self.pending_orders.pop(order_id, None)
+            if pending_order is None:
+                # 이미 제거된 주문 (정리 대기 중 다른 경로로 제거된 항목 등)은 캐시 유지
+                return None
+            self._active_orders.pop(order_id, None)
+            self._tracking_status_dirty = True
+            self._pending_snapshot = None
+            if pending_order.signal_type is _SELL:
+                sell_ids = self._pending_sell_ids_by_code.get(pending_order.stock_code)
+                if sell_ids is not None:
+                    sell_ids.discard(order_id)
+                    if not sell_ids:
+                        self._pending_sell_ids_by_code.pop(pending_order.stock_code, None)
+        return pending_order
+    
     def _get_pending_sell_quantity(self, stock_code: str) -> int:
-        """특정 종목의 대기 중인 매도 주문 수량 계산"""
-        try:
-            pending_quantity = 0
-            
-            for pending_order in self.pending_orders.values():
-                if (pending_order.stock_code == stock_code and 
-                    pending_order.signal_type == SignalType.SELL and
-                    pending_order.order_status in [OrderStatus.PENDING, OrderStatus.PARTIAL_FILLED]):
+        """특정 종목의 대기 중인 매도 주문 수량 계산 (종목별 인덱스로 해당 주문만 조회)"""
+        pending_quantity = 0
+        
+        with self._pending_lock:
+            for order_id in self._pending_sell_ids_by_code.get(stock_code, ()):
+                pending_order = self.pending_orders.get(order_id)
+                if (pending_order is not None and
+                    pending_order.order_status in _ACTIVE_STATUSES):
                     
                     # 🔍 아직 체결되지 않은 수량만 계산
-                    remaining_quantity = pending_order.remaining_quantity
-                    pending_quantity += remaining_quantity
-            
-            return pending_quantity
-            
-        except Exception as e:
-            self.logger.error(f"❌ 대기 중인 매도 수량 계산 오류: {e}")
-            return 0 
\ No newline at end of file
+                    pending_quantity += pending_order.remaining_quantity
+        
+        return pending_quantity
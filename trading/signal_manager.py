@@ -262,14 +262,14 @@ class TradingSignalManager:
                 
                 # 🎯 패턴별 차별화 매도 조건 확인
                 if position.pattern_type:
-                    pattern_exit_signal = self._check_pattern_based_exit(position)
+                    pattern_exit_signal = self._check_pattern_based_exit(position, now_time)
                     if pattern_exit_signal:
                         signals.append(pattern_exit_signal)
                         continue  # 패턴 기반 신호가 생성되면 기본 로직 스킵
                 
                 # 🕐 시간 기반 매도 조건 확인 (최우선)
                 if self.config.enable_time_based_exit:
-                    holding_days = safe_datetime_subtract(now_kst(), position.entry_time).days
+                    holding_days = safe_datetime_subtract(now_time, position.entry_time).days
                     
                     # 1. 최대 보유 기간 초과 시 강제 매도
                     if holding_days >= self.config.max_holding_days:
@@ -282,7 +282,7 @@ class TradingSignalManager:
                             reason=f"최대 보유기간 초과 매도 - {holding_days}일 보유 "
                                    f"(최대: {self.config.max_holding_days}일)",
                             confidence=1.0,
-                            timestamp=now_kst()
+                            timestamp=now_time
                         )
                         signals.append(signal)
                         continue
@@ -300,7 +300,7 @@ class TradingSignalManager:
                                    f"손익률: {position.profit_loss_rate:.2f}% "
                                    f"(임계값: ±{self.config.sideways_threshold:.1%})",
                             confidence=0.8,
-                            timestamp=now_kst()
+                            timestamp=now_time
                         )
                         signals.append(signal)
                         continue
@@ -321,7 +321,7 @@ class TradingSignalManager:
                                        f"수익률: {position.profit_loss_rate:.2f}% "
                                        f"({partial_quantity}주/{position.quantity}주)",
                                 confidence=0.7,
-                                timestamp=now_kst(),
+                                timestamp=now_time,
                                 metadata={
                                     'is_partial_exit': True,
                                     'partial_exit_ratio': self.config.partial_exit_ratio,
@@ -345,7 +345,7 @@ class TradingSignalManager:
                         reason=f"패턴 기반 손절매 - 현재가: {position.current_price:,.0f}원, "
                                f"손절가: {position.stop_loss_price:,.0f}원",
                         confidence=1.0,  # 손절매는 신뢰도 100%
-                        timestamp=now_kst()
+                        timestamp=now_time
                     )
                     signals.append(signal)
                     
@@ -361,7 +361,7 @@ class TradingSignalManager:
                         reason=f"패턴 기반 익절매 - 현재가: {position.current_price:,.0f}원, "
                                f"목표가: {position.take_profit_price:,.0f}원",
                         confidence=1.0,  # 익절매는 신뢰도 100%
-                        timestamp=now_kst()
+                        timestamp=now_time
                     )
                     signals.append(signal)
                     
@@ -376,7 +376,7 @@ class TradingSignalManager:
                             quantity=position.quantity,
                             reason=f"기본 손절매 - 손실률: {position.profit_loss_rate:.1f}%",
                             confidence=1.0,
-                            timestamp=now_kst()
+                            timestamp=now_time
                         )
                         signals.append(signal)
                     elif position.profit_loss_rate >= 3.0:  # 3% 수익으로 보수적 조정
@@ -388,7 +388,7 @@ class TradingSignalManager:
                             quantity=position.quantity,
                             reason=f"기본 익절매 - 수익률: {position.profit_loss_rate:.1f}%",
                             confidence=1.0,
-                            timestamp=now_kst()
+                            timestamp=now_time
                         )
                         signals.append(signal)
             
@@ -601,28 +601,23 @@ class TradingSignalManager:
         try:
             self.logger.debug("📊 매매 신호 처리 중...")
             
-            # 매매 신호 처리
-            for signal in signals:
+            if not self.order_manager:
+                self.logger.error("❌ 주문 매니저 없음")
+                return
+            
+            # 매매 신호 처리 (신호 순서대로 주문 후 결과 처리)
+            for signal, order_result in self.order_manager.execute_signals(signals, positions, account_info):
                 if signal.signal_type == SignalType.BUY:
-                    self._execute_buy_order(signal, positions, account_info)
-                elif signal.signal_type == SignalType.SELL:
-                    self._execute_sell_order(signal, positions)
+                    self._handle_buy_order_result(signal, order_result)
+                else:
+                    self._handle_sell_order_result(signal, order_result)
                     
         except Exception as e:
             self.logger.error(f"❌ 매매 신호 처리 오류: {e}")
     
-    def _execute_buy_order(self, 
-                          signal: TradingSignal,
-                          positions: Dict[str, Position],
-                          account_info: Optional[AccountInfo]) -> None:
-        """매수 주문 실행"""
+    def _handle_buy_order_result(self, signal: TradingSignal, order_result: Optional[OrderResult]) -> None:
+        """매수 주문 결과 처리"""
         try:
-            if not self.order_manager:
-                self.logger.error("❌ 주문 매니저 없음")
-                return
-            
-            order_result = self.order_manager.execute_buy_order(signal, positions, account_info)
-            
             if order_result and order_result.success:
                 # 거래 기록 추가 (주문 성공 시)
                 self._add_trade_record("BUY", signal, order_result)
@@ -635,19 +630,11 @@ class TradingSignalManager:
                 self.logger.info(f"🔄 체결 대기 중... (주문ID: {order_result.order_id})")
                 
         except Exception as e:
-            self.logger.error(f"❌ 매수 주문 실행 오류: {e}")
+            self.logger.error(f"❌ 매수 주문 결과 처리 오류: {e}")
     
-    def _execute_sell_order(self, 
-                           signal: TradingSignal,
-                           positions: Dict[str, Position]) -> None:
-        """매도 주문 실행"""
+    def _handle_sell_order_result(self, signal: TradingSignal, order_result: Optional[OrderResult]) -> None:
+        """매도 주문 결과 처리"""
         try:
-            if not self.order_manager:
-                self.logger.error("❌ 주문 매니저 없음")
-                return
-            
-            order_result = self.order_manager.execute_sell_order(signal, positions)
-            
             if order_result and order_result.success:
                 # 거래 기록 추가 (주문 성공 시)
                 self._add_trade_record("SELL", signal, order_result)
@@ -660,7 +647,7 @@ class TradingSignalManager:
                 self.logger.info(f"🔄 체결 대기 중... (주문ID: {order_result.order_id})")
                 
         except Exception as e:
-            self.logger.error(f"❌ 매도 주문 실행 오류: {e}")
+            self.logger.error(f"❌ 매도 주문 결과 처리 오류: {e}")
     
     def _add_trade_record(self, 
                          trade_type: str, 
@@ -716,12 +703,14 @@ class TradingSignalManager:
                 'win_rate': 0.0
             }
     
-    def _check_pattern_based_exit(self, position: Position) -> Optional[TradingSignal]:
+    def _check_pattern_based_exit(self, position: Position,
+                                  current_time: Optional[datetime] = None) -> Optional[TradingSignal]:
         """
         패턴별 차별화된 매도 조건 확인
         
         Args:
             position: 포지션 정보
+            current_time: 기준 시각 (매도 스캔 단위로 공유, 없으면 현재 시각)
             
         Returns:
             Optional[TradingSignal]: 매도 신호 (조건 만족 시)
@@ -738,7 +727,8 @@ class TradingSignalManager:
             if not pattern_config:
                 return None
             
-            current_time = now_kst()
+            if current_time is None:
+                current_time = now_kst()
             holding_days = safe_datetime_subtract(current_time, position.entry_time).days
             
             # 1. 🕐 패턴별 최대 보유기간 확인